@@ -13,10 +13,12 @@ Beads Integration:
 
 import json
 import sys
-import subprocess
 import os
+import time
 from datetime import datetime
 
+# hooks/utils is imported as the utils package from the hooks directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Tool types worth logging
 LOGGABLE_TOOLS = [
@@ -34,9 +36,20 @@ SKIP_TOOLS = [
     "Grep",
 ]
 
+# Notes waiting to be sent to Beads, one JSON file per note in this user's
+# cache for the project, outside .beads so queueing never looks like a
+# Beads change. Parallel hooks never share a file: a flush claims each note
+# by renaming it, so a note is sent once and one queued mid-flush waits for
+# the next batch. The Stop hook flushes what is left when the session ends
+PENDING_NOTES_CACHE = "tool-usage-pending"
+
+# Queued notes that trigger a single Beads update
+FLUSH_THRESHOLD = 10
+
 
 def run_beads_command(args: list[str]) -> bool:
     """Execute a Beads CLI command."""
+    import subprocess
     try:
         result = subprocess.run(
             ["bd"] + args,
@@ -49,12 +62,9 @@ def run_beads_command(args: list[str]) -> bool:
         return False
 
 
-def log_to_beads(tool_name: str, summary: str):
-    """Log tool usage to Beads context."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    note = f"[{timestamp}] {tool_name}: {summary[:100]}"
-
-    # Get current task if any
+def current_task_id() -> str | None:
+    """Return the id of the task Beads is currently tracking, if any."""
+    import subprocess
     try:
         result = subprocess.run(
             ["bd", "current", "--json"],
@@ -63,39 +73,126 @@ def log_to_beads(tool_name: str, summary: str):
             timeout=5
         )
         if result.returncode == 0:
-            current = json.loads(result.stdout)
-            task_id = current.get("id")
-            if task_id:
-                run_beads_command(["update", task_id, "--add-note", note, "--json"])
-                return
+            return json.loads(result.stdout).get("id")
     except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
         pass
+    return None
 
-    # No current task, log to session context
-    run_beads_command(["set", f"tool-usage-{timestamp}", note])
 
+def pending_notes_dir() -> str:
+    """Return this project's note queue directory, creating it if needed."""
+    from utils.common import project_cache_dir
+    return project_cache_dir(PENDING_NOTES_CACHE)
 
-def get_tool_summary(tool_name: str, tool_input: dict, tool_result: dict) -> str:
-    """Generate a summary of the tool operation."""
-    if tool_name == "Write":
-        path = tool_input.get("file_path", "unknown")
-        return f"Created/wrote {path}"
 
-    elif tool_name == "Edit":
-        path = tool_input.get("file_path", "unknown")
-        return f"Edited {path}"
+def queue_note(entry: dict) -> int:
+    """Add a note to the pending queue and return how many are queued."""
+    pending_dir = pending_notes_dir()
+    name = f"{time.time_ns()}-{os.getpid()}"
+    tmp_path = os.path.join(pending_dir, name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(entry, f)
+    # Appear whole or not at all to a concurrent flush
+    os.replace(tmp_path, os.path.join(pending_dir, name + ".json"))
+    return sum(1 for queued in os.listdir(pending_dir) if queued.endswith(".json"))
+
+
+def claim_notes() -> list[dict]:
+    """Take every queued note, oldest first, that no other flush has taken."""
+    try:
+        pending_dir = pending_notes_dir()
+        names = sorted(name for name in os.listdir(pending_dir) if name.endswith(".json"))
+    except OSError:
+        return []
+
+    entries = []
+    for name in names:
+        path = os.path.join(pending_dir, name)
+        claimed_path = f"{path}.{os.getpid()}.claimed"
+        try:
+            os.replace(path, claimed_path)
+        except OSError:
+            continue  # Another flush got it first
+        try:
+            with open(claimed_path, "r") as f:
+                entries.append(json.load(f))
+            os.remove(claimed_path)
+        except (IOError, json.JSONDecodeError):
+            pass
+    return entries
+
+
+def flush_notes(entries: list[dict]):
+    """Send notes to Beads as one joined note on the task current at flush time."""
+    if not entries:
+        return
+    batch = "\n".join(entry.get("note", "") for entry in entries)
+
+    task_id = current_task_id()
+    if task_id:
+        run_beads_command(["update", task_id, "--add-note", batch, "--json"])
+    else:
+        # No current task, log to session context
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        run_beads_command(["set", f"tool-usage-{timestamp}", batch])
+
+
+def log_to_beads(tool_name: str, summary: str):
+    """Log tool usage to Beads context, batching FLUSH_THRESHOLD notes per call."""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    entry = {"note": f"[{timestamp}] {tool_name}: {summary[:100]}"}
+
+    try:
+        pending = queue_note(entry)
+    except OSError:
+        # Queue unusable, send this note on its own
+        flush_notes([entry])
+        return
+
+    if pending >= FLUSH_THRESHOLD:
+        flush_notes(claim_notes())
+
+
+def summarize_write(tool_input: dict) -> str:
+    """Summarize a Write operation."""
+    return f"Created/wrote {tool_input.get('file_path', 'unknown')}"
+
+
+def summarize_edit(tool_input: dict) -> str:
+    """Summarize an Edit operation."""
+    return f"Edited {tool_input.get('file_path', 'unknown')}"
+
+
+def summarize_multi_edit(tool_input: dict) -> str:
+    """Summarize a MultiEdit operation."""
+    return f"Multi-edited {len(tool_input.get('edits', []))} files"
+
 
-    elif tool_name == "MultiEdit":
-        edits = tool_input.get("edits", [])
-        return f"Multi-edited {len(edits)} files"
+def summarize_bash(tool_input: dict) -> str:
+    """Summarize a Bash command."""
+    return f"Ran: {tool_input.get('command', '')[:50]}"
 
-    elif tool_name == "Bash":
-        command = tool_input.get("command", "")[:50]
-        return f"Ran: {command}"
 
-    elif tool_name == "Task":
-        agent = tool_input.get("subagent_type", "unknown")
-        return f"Spawned {agent} agent"
+def summarize_task(tool_input: dict) -> str:
+    """Summarize a Task (sub-agent) launch."""
+    return f"Spawned {tool_input.get('subagent_type', 'unknown')} agent"
+
+
+# Tool name -> summary builder
+TOOL_SUMMARIES = {
+    "Write": summarize_write,
+    "Edit": summarize_edit,
+    "MultiEdit": summarize_multi_edit,
+    "Bash": summarize_bash,
+    "Task": summarize_task,
+}
+
+
+def get_tool_summary(tool_name: str, tool_input: dict, tool_result: dict) -> str:
+    """Generate a summary of the tool operation."""
+    summarize = TOOL_SUMMARIES.get(tool_name)
+    if summarize:
+        return summarize(tool_input)
 
     return f"Used {tool_name}"
 
@@ -106,6 +203,11 @@ def main():
     if not os.path.exists(".beads"):
         sys.exit(0)
 
+    # The Stop hook runs us with --flush to send what is left in the queue
+    if sys.argv[1:2] == ["--flush"]:
+        flush_notes(claim_notes())
+        sys.exit(0)
+
     # Read tool result from stdin
     input_data = sys.stdin.read()
 
@@ -15,10 +15,12 @@ Security Patterns Blocked:
 import json
 import sys
 import re
-from typing import Any
 
 
-# Dangerous patterns to block
+# Tools whose file_path is checked against SENSITIVE_FILES
+FILE_ACCESS_TOOLS = frozenset({"Read", "Write", "Edit"})
+
+# Dangerous patterns to block, matched against the lowercased command
 BLOCKED_PATTERNS = [
     # Destructive file operations
     r"rm\s+-rf\s+/",
@@ -35,7 +37,7 @@ BLOCKED_PATTERNS = [
     # Unsafe git operations
     r"git\s+push\s+.*--force\s+.*main",
     r"git\s+push\s+.*--force\s+.*master",
-    r"git\s+reset\s+--hard\s+HEAD~\d+",
+    r"git\s+reset\s+--hard\s+head~\d+",
 ]
 
 # Sensitive file patterns
@@ -51,13 +53,18 @@ SENSITIVE_FILES = [
     r"\.pypirc$",
 ]
 
+# Compiled once at load; these run on every tool call. Commands are
+# matched lowercased, and the sensitive-file patterns share one
+# case-insensitive alternation so a path is scanned once
+_BLOCKED_REGEXES = [(pattern, re.compile(pattern)) for pattern in BLOCKED_PATTERNS]
+_SENSITIVE_RE = re.compile("|".join(SENSITIVE_FILES), re.IGNORECASE)
+
 
 def is_blocked_command(command: str) -> tuple[bool, str]:
     """Check if a command should be blocked."""
     command_lower = command.lower()
-
-    for pattern in BLOCKED_PATTERNS:
-        if re.search(pattern, command_lower):
+    for pattern, regex in _BLOCKED_REGEXES:
+        if regex.search(command_lower):
             return True, f"Blocked: Destructive pattern '{pattern}'"
 
     return False, ""
@@ -65,9 +72,8 @@ def is_blocked_command(command: str) -> tuple[bool, str]:
 
 def is_sensitive_file_access(path: str) -> tuple[bool, str]:
     """Check if accessing sensitive files."""
-    for pattern in SENSITIVE_FILES:
-        if re.search(pattern, path, re.IGNORECASE):
-            return True, f"Blocked: Sensitive file access '{path}'"
+    if _SENSITIVE_RE.search(path):
+        return True, f"Blocked: Sensitive file access '{path}'"
 
     return False, ""
 
@@ -85,7 +91,7 @@ def check_tool_use(tool_input: dict) -> tuple[bool, str]:
             return True, reason
 
     # Check file read/write operations
-    if tool_name in ["Read", "Write", "Edit"]:
+    if tool_name in FILE_ACCESS_TOOLS:
         file_path = tool_input_data.get("file_path", "")
         blocked, reason = is_sensitive_file_access(file_path)
         if blocked:
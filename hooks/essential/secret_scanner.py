@@ -16,9 +16,12 @@ Security Patterns Detected:
 import json
 import sys
 import re
-from typing import Any
+from typing import NamedTuple
 
 
+# Tools whose written content is scanned
+SCANNED_TOOLS = frozenset({"Write", "Edit", "MultiEdit"})
+
 # Regex patterns for secret detection
 SECRET_PATTERNS = {
     "api_key": [
@@ -57,33 +60,54 @@ ALLOWED_PATTERNS = [
 ]
 
 
+class SecretFinding(NamedTuple):
+    """A single secret match; a tuple keeps many findings cheap."""
+    type: str
+    pattern: str
+    context: str
+    position: int
+
+
+def _scoped(pattern: str) -> str:
+    """Turn a leading global (?i) into a scoped group so patterns can be joined."""
+    if pattern.startswith("(?i)"):
+        return f"(?i:{pattern[4:]})"
+    return f"(?:{pattern})"
+
+
+# Pattern database compiled once at import: (type, label, regex) per pattern,
+# plus a union used to reject clean content in a single pass
+_SECRET_REGEXES = [
+    (secret_type, pattern[:30] + "...", re.compile(pattern))
+    for secret_type, patterns in SECRET_PATTERNS.items()
+    for pattern in patterns
+]
+_ANY_SECRET_RE = re.compile(
+    "|".join(_scoped(p) for patterns in SECRET_PATTERNS.values() for p in patterns)
+)
+_ALLOWED_RE = re.compile("|".join(ALLOWED_PATTERNS))
+
+
 def is_allowed_file(file_path: str) -> bool:
     """Check if file is allowed to contain secret-like patterns."""
-    for pattern in ALLOWED_PATTERNS:
-        if re.search(pattern, file_path):
-            return True
-    return False
+    return _ALLOWED_RE.search(file_path) is not None
 
 
-def scan_for_secrets(content: str) -> list[dict]:
+def scan_for_secrets(content: str) -> list[SecretFinding]:
     """Scan content for secrets and return findings."""
     findings = []
 
-    for secret_type, patterns in SECRET_PATTERNS.items():
-        for pattern in patterns:
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                # Get context around the match
-                start = max(0, match.start() - 20)
-                end = min(len(content), match.end() + 20)
-                context = content[start:end].replace("\n", " ")
-
-                findings.append({
-                    "type": secret_type,
-                    "pattern": pattern[:30] + "...",
-                    "context": f"...{context}...",
-                    "position": match.start(),
-                })
+    if not _ANY_SECRET_RE.search(content):
+        return findings
+
+    for secret_type, label, regex in _SECRET_REGEXES:
+        for match in regex.finditer(content):
+            # Get context around the match
+            start = max(0, match.start() - 20)
+            end = min(len(content), match.end() + 20)
+            context = content[start:end].replace("\n", " ")
+
+            findings.append(SecretFinding(secret_type, label, f"...{context}...", match.start()))
 
     return findings
 
@@ -102,12 +126,12 @@ def main():
     tool_input = data.get("tool_input", {})
 
     # Only scan Write and Edit operations
-    if tool_name not in ["Write", "Edit", "MultiEdit"]:
+    if tool_name not in SCANNED_TOOLS:
         sys.exit(0)
 
-    # Check if it's an allowed file
-    file_path = tool_input.get("file_path", "")
-    if is_allowed_file(file_path):
+    # Allowed files skip the scan; checked first so MultiEdit payloads
+    # are never joined for nothing
+    if is_allowed_file(tool_input.get("file_path", "")):
         sys.exit(0)
 
     # Get content to scan
@@ -120,6 +144,10 @@ def main():
         edits = tool_input.get("edits", [])
         content = " ".join(e.get("new_string", "") for e in edits)
 
+    # Deletions carry nothing to scan
+    if not content.strip():
+        sys.exit(0)
+
     # Scan for secrets
     findings = scan_for_secrets(content)
 
@@ -129,7 +157,7 @@ def main():
             "decision": "block",
             "reason": f"Potential secrets detected: {len(findings)} finding(s)",
             "findings": [
-                f"{f['type']}: {f['context']}"
+                f"{f.type}: {f.context}"
                 for f in findings[:3]  # Show first 3
             ]
         }
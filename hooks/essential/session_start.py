@@ -11,10 +11,12 @@ Beads Integration:
 - Sets up task tracking for the session
 """
 
+import io
 import subprocess
 import json
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 
 def run_beads_command(args: list[str]) -> dict | None:
@@ -41,13 +43,17 @@ def load_beads_context() -> dict:
         "session_restored": False
     }
 
-    # Get ready tasks
-    ready = run_beads_command(["ready", "--json"])
+    # Ready and stale (forgotten) tasks are independent CLI calls; run them
+    # side by side so session start waits on the slower one, not the sum
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ready_future = pool.submit(run_beads_command, ["ready", "--json"])
+        stale_future = pool.submit(run_beads_command, ["stale", "--days", "3", "--json"])
+
+    ready = ready_future.result()
     if ready and "tasks" in ready:
         context["ready_tasks"] = ready["tasks"]
 
-    # Get stale tasks (forgotten items)
-    stale = run_beads_command(["stale", "--days", "3", "--json"])
+    stale = stale_future.result()
     if stale and "tasks" in stale:
         context["stale_tasks"] = stale["tasks"]
 
@@ -85,20 +91,23 @@ def main():
     context = load_beads_context()
 
     if context["session_restored"]:
-        print("=" * 60)
-        print("BEADS SESSION CONTEXT RESTORED")
-        print("=" * 60)
+        # Build the banner in one buffer and write it once
+        out = io.StringIO()
+        print("=" * 60, file=out)
+        print("BEADS SESSION CONTEXT RESTORED", file=out)
+        print("=" * 60, file=out)
 
         if context["ready_tasks"]:
-            print(f"\nReady Tasks ({len(context['ready_tasks'])}):")
-            print(format_task_summary(context["ready_tasks"]))
+            print(f"\nReady Tasks ({len(context['ready_tasks'])}):", file=out)
+            print(format_task_summary(context["ready_tasks"]), file=out)
 
         if context["stale_tasks"]:
-            print(f"\nStale Tasks (needs attention):")
-            print(format_task_summary(context["stale_tasks"]))
+            print(f"\nStale Tasks (needs attention):", file=out)
+            print(format_task_summary(context["stale_tasks"]), file=out)
 
-        print("\nUse `bd ready --json` for full task list")
-        print("=" * 60)
+        print("\nUse `bd ready --json` for full task list", file=out)
+        print("=" * 60, file=out)
+        sys.stdout.write(out.getvalue())
 
     sys.exit(0)
 
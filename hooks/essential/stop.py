@@ -63,6 +63,15 @@ def get_session_stats() -> dict:
     return stats
 
 
+def flush_tool_usage_notes():
+    """Send tool usage notes post_tool_use queued but has not sent yet."""
+    hook_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "post_tool_use.py")
+    try:
+        subprocess.run([sys.executable, hook_path, "--flush"], capture_output=True, timeout=60)
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+
+
 def sync_beads() -> bool:
     """Sync Beads context to disk."""
     result = run_beads_command(["sync"])
@@ -97,6 +106,9 @@ def main():
     # Get session stats before sync
     stats = get_session_stats()
 
+    # Send queued tool usage notes, so the sync includes them
+    flush_tool_usage_notes()
+
     # CRITICAL: Sync Beads context
     sync_success = sync_beads()
 
@@ -13,69 +13,65 @@ Features:
 
 import json
 import sys
-import re
 import subprocess
 import os
 
 
-# Command patterns to detect
-COMMAND_PATTERNS = {
-    r"^/status\s*$": "Check project status",
-    r"^/next\s*$": "Get next task",
-    r"^/ready\s*$": "Show ready tasks",
-    r"^/sync\s*$": "Sync Beads context",
+# Shortcut commands: description and expanded prompt, keyed by the
+# normalized prompt so detection is a single dict lookup
+COMMANDS = {
+    "/status": (
+        "Check project status",
+        "Show me the current project status using `bd ready --json` and `bd stale --json`",
+    ),
+    "/next": (
+        "Get next task",
+        "Find and show me the next task to work on using `bd ready --json`",
+    ),
+    "/ready": (
+        "Show ready tasks",
+        "List all ready tasks using `bd ready --json`",
+    ),
+    "/sync": (
+        "Sync Beads context",
+        "Sync the Beads context using `bd sync`",
+    ),
 }
 
 
-def run_beads_command(args: list[str]) -> dict | None:
-    """Execute a Beads CLI command and return parsed JSON output."""
+def spawn_beads_command(args: list[str]):
+    """Start a Beads CLI command in the background without waiting for it."""
     try:
-        result = subprocess.run(
+        subprocess.Popen(
             ["bd"] + args,
-            capture_output=True,
-            text=True,
-            timeout=30
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
-        if result.returncode == 0 and result.stdout:
-            try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError:
-                return {"success": True, "output": result.stdout}
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except OSError:
         pass
-    return None
+
+
+def lookup_command(prompt: str) -> tuple[str, str] | None:
+    """Return the shortcut entry for a prompt, normalizing it once."""
+    return COMMANDS.get(prompt.strip().lower())
 
 
 def detect_command(prompt: str) -> tuple[bool, str]:
     """Detect if prompt is a special command."""
-    prompt_clean = prompt.strip().lower()
-
-    for pattern, description in COMMAND_PATTERNS.items():
-        if re.match(pattern, prompt_clean):
-            return True, description
+    command = lookup_command(prompt)
+    if command:
+        return True, command[0]
 
     return False, ""
 
 
 def transform_prompt(prompt: str) -> str:
     """Transform prompt if needed (e.g., expand shortcuts)."""
-    prompt_clean = prompt.strip()
-
-    # Expand /status to full command
-    if re.match(r"^/status\s*$", prompt_clean, re.IGNORECASE):
-        return "Show me the current project status using `bd ready --json` and `bd stale --json`"
-
-    # Expand /next to full command
-    if re.match(r"^/next\s*$", prompt_clean, re.IGNORECASE):
-        return "Find and show me the next task to work on using `bd ready --json`"
-
-    # Expand /ready to full command
-    if re.match(r"^/ready\s*$", prompt_clean, re.IGNORECASE):
-        return "List all ready tasks using `bd ready --json`"
-
-    # Expand /sync
-    if re.match(r"^/sync\s*$", prompt_clean, re.IGNORECASE):
-        return "Sync the Beads context using `bd sync`"
+    command = lookup_command(prompt)
+    if command:
+        return command[1]
 
     return prompt
 
@@ -89,9 +85,9 @@ def log_user_request(prompt: str):
     if len(prompt.strip()) < 10:
         return
 
-    # Truncate for logging
+    # Truncate for logging; the prompt is never held up waiting on Beads
     summary = prompt[:100].replace("\n", " ")
-    run_beads_command(["set", "last-user-request", summary])
+    spawn_beads_command(["set", "last-user-request", summary])
 
 
 def main():
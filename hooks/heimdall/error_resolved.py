@@ -12,17 +12,18 @@ This hook captures:
 - Prevention strategies
 """
 
+import os
 import sys
-import json
 import re
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any
 
 from .utils import (
-    store_memory,
+    dumps_json,
+    enqueue_memory,
     generate_standard_tags,
     extract_tech_from_content,
-    parse_hook_input,
+    parse_hook_input_for_tools,
     safe_hook_execution,
     log_hook_error,
     is_heimdall_ready,
@@ -30,7 +31,7 @@ from .utils import (
 
 
 # Patterns that indicate error resolution activity
-ERROR_INDICATORS = [
+ERROR_INDICATORS = (
     "error",
     "exception",
     "failed",
@@ -42,53 +43,95 @@ ERROR_INDICATORS = [
     "debugging",
     "traceback",
     "stack trace",
+)
+
+# Stems of the fix patterns (fix(?:ed|ing)?, resolv(?:ed|ing)?, ...); each
+# pattern matches exactly when its stem occurs
+FIX_STEMS = ("fix", "resolv", "debug", "patch")
+
+# Events scoring at least this many indicators count as error resolutions
+MIN_INDICATOR_SCORE = 2
+
+# Each distinct indicator and each fix stem present scores one point, so
+# "fix" (both) scores two
+_INDICATOR_WEIGHTS = {term: ERROR_INDICATORS.count(term) + FIX_STEMS.count(term)
+                      for term in ERROR_INDICATORS + FIX_STEMS}
+
+# All terms as one zero-width lookahead alternation, longest first. At a
+# given position only the longest term is reported, so each match also
+# credits the shorter terms it contains ("fixed" -> "fix"). The leading
+# class of first letters rejects most positions before the alternation runs
+_INDICATOR_RE = re.compile(
+    "(?=[" + re.escape("".join(sorted({term[0] for term in _INDICATOR_WEIGHTS}))) + "])"
+    "(?=(" + "|".join(map(re.escape, sorted(_INDICATOR_WEIGHTS, key=len, reverse=True))) + "))"
+)
+_INDICATOR_CLOSURE = {
+    term: frozenset(other for other in _INDICATOR_WEIGHTS if other in term)
+    for term in _INDICATOR_WEIGHTS
+}
+
+# Error message lines in command output, in priority order. The first
+# pattern is case-insensitive, so it already covers "TypeError:" and
+# "SyntaxError:" lines
+ERROR_MESSAGE_PATTERNS = [
+    re.compile(r"(Error:.*?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"(error\[.*?\]:.*?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"(Exception:.*?)(?:\n|$)", re.IGNORECASE),
 ]
 
+# Error types looked for in the event text, in priority order; plain
+# substring tests beat a regex alternation for a handful of literals
+ERROR_TYPES = ("typeerror", "syntaxerror", "referenceerror", "valueerror", "keyerror")
+
+# Only the head and tail of a large event are scanned; the command and
+# first errors lead the text and a traceback summary ends it
+EVENT_HEAD_CHARS = 16_384
+EVENT_TAIL_CHARS = 4_096
+
+# Technology hinted by a resolved file's extension (lowercase, no dot)
+EXTENSION_TECH = {
+    "ts": "typescript",
+    "tsx": "typescript",
+    "js": "javascript",
+    "jsx": "javascript",
+    "py": "python",
+}
+
 # Tools commonly used in debugging
-DEBUG_TOOLS = [
+DEBUG_TOOLS = frozenset({
     "Edit",
     "Bash",
-]
-
+})
 
-def is_error_resolution_event(data: Dict[str, Any]) -> bool:
-    """Check if this event indicates error resolution."""
-    tool_name = data.get("tool_name", "")
-    tool_input = data.get("tool_input", {})
-    tool_result = data.get("tool_result", {})
-
-    # Must be a debug-related tool
-    if tool_name not in DEBUG_TOOLS:
-        return False
 
-    # Check for error indicators in various places
+def event_text(data: Dict[str, Any]) -> str:
+    """Lowercased JSON of the tool input and result, built once per event."""
     content_to_check = [
-        json.dumps(tool_input),
-        json.dumps(tool_result),
+        dumps_json(data.get("tool_input", {})),
+        dumps_json(data.get("tool_result", {})),
     ]
+    combined = " ".join(content_to_check)
+    if len(combined) > EVENT_HEAD_CHARS + EVENT_TAIL_CHARS:
+        combined = combined[:EVENT_HEAD_CHARS] + " " + combined[-EVENT_TAIL_CHARS:]
+    return combined.lower()
 
-    combined = " ".join(content_to_check).lower()
 
-    # Count how many error indicators are present
-    indicator_count = sum(1 for ind in ERROR_INDICATORS if ind in combined)
+def is_error_resolution_event(combined: str) -> bool:
+    """Check if a debug tool event's text indicates error resolution."""
+    # Score distinct indicators in one pass, stopping once there are enough
+    found = set()
+    score = 0
+    for match in _INDICATOR_RE.finditer(combined):
+        for term in _INDICATOR_CLOSURE[match.group(1)] - found:
+            found.add(term)
+            score += _INDICATOR_WEIGHTS[term]
+        if score >= MIN_INDICATOR_SCORE:
+            return True
 
-    # Also look for fix patterns
-    fix_patterns = [
-        r"fix(?:ed|ing)?",
-        r"resolv(?:ed|ing)?",
-        r"debug(?:ged|ging)?",
-        r"patch(?:ed|ing)?",
-    ]
-
-    for pattern in fix_patterns:
-        if re.search(pattern, combined, re.IGNORECASE):
-            indicator_count += 1
+    return False
 
-    # If we have enough indicators, consider it an error resolution
-    return indicator_count >= 2
 
-
-def extract_error_info(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def extract_error_info(data: Dict[str, Any], combined: str) -> Optional[Dict[str, Any]]:
     """Extract error resolution information from event data."""
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {})
@@ -119,16 +162,8 @@ def extract_error_info(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         result_text = str(tool_result)
 
         # Look for error messages in command output
-        error_patterns = [
-            r"(Error:.*?)(?:\n|$)",
-            r"(error\[.*?\]:.*?)(?:\n|$)",
-            r"(TypeError:.*?)(?:\n|$)",
-            r"(SyntaxError:.*?)(?:\n|$)",
-            r"(Exception:.*?)(?:\n|$)",
-        ]
-
-        for pattern in error_patterns:
-            match = re.search(pattern, result_text, re.IGNORECASE)
+        for regex in ERROR_MESSAGE_PATTERNS:
+            match = regex.search(result_text)
             if match:
                 error_info["error_message"] = match.group(1)[:200]
                 break
@@ -136,9 +171,7 @@ def extract_error_info(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         error_info["resolution"] = f"Ran command: {command[:100]}"
 
     # Try to identify error type
-    combined = json.dumps(data).lower()
-    error_types = ["typeerror", "syntaxerror", "referenceerror", "valueerror", "keyerror"]
-    for et in error_types:
+    for et in ERROR_TYPES:
         if et in combined:
             error_info["error_type"] = et.replace("error", "Error")
             break
@@ -146,69 +179,47 @@ def extract_error_info(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return error_info
 
 
-def create_error_memory_content(error_info: Dict[str, Any], data: Dict[str, Any]) -> str:
-    """Create memory content from error resolution information."""
-    content_parts = [
-        "# Error Resolution",
-        "",
-    ]
-
-    if error_info.get("error_type"):
-        content_parts.extend([
-            f"## Error Type: {error_info['error_type']}",
-            "",
-        ])
-
-    if error_info.get("error_message"):
-        content_parts.extend([
-            "## Error Message",
-            f"```",
-            error_info["error_message"],
-            "```",
-            "",
-        ])
-
-    if error_info.get("resolution"):
-        content_parts.extend([
-            "## Resolution",
-            error_info["resolution"],
-            "",
-        ])
+def classify_event(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Error info for an error resolution event, or None for any other event."""
+    # One serialization of the event serves both the gate and the extraction
+    combined = event_text(data)
+    if not is_error_resolution_event(combined):
+        return None
+    return extract_error_info(data, combined)
 
-    if error_info.get("file_path"):
-        content_parts.extend([
-            f"## File",
-            error_info["file_path"],
-            "",
-        ])
-
-    content_parts.extend([
-        "## Resolution Context",
-        f"Tool used: {error_info.get('tool', 'unknown')}",
-        f"Resolved at: {datetime.now().isoformat()}",
-    ])
 
-    return "\n".join(content_parts)
+def create_error_memory_content(error_info: Dict[str, Any], data: Dict[str, Any]) -> str:
+    """Create memory content from error resolution information."""
+    # One template with optional sections, rather than a parts list joined
+    # at the end
+    return (
+        "# Error Resolution\n\n"
+        + (f"## Error Type: {error_type}\n\n" if (error_type := error_info.get("error_type")) else "")
+        + (f"## Error Message\n```\n{message}\n```\n\n" if (message := error_info.get("error_message")) else "")
+        + (f"## Resolution\n{resolution}\n\n" if (resolution := error_info.get("resolution")) else "")
+        + (f"## File\n{file_path}\n\n" if (file_path := error_info.get("file_path")) else "")
+        + "## Resolution Context\n"
+        f"Tool used: {error_info.get('tool', 'unknown')}\n"
+        f"Resolved at: {time.strftime('%Y-%m-%dT%H:%M:%S')}"
+    )
 
 
 @safe_hook_execution
 def main():
     """Main hook execution."""
-    # Check if Heimdall is ready
-    if not is_heimdall_ready():
-        sys.exit(0)
-
-    # Parse input
-    data = parse_hook_input()
+    # Parse input from debug-related tools only; other events are skipped
+    # before decoding, and before the Heimdall readiness check, which may
+    # have to spawn the CLI
+    data = parse_hook_input_for_tools(DEBUG_TOOLS)
     if not data:
         sys.exit(0)
 
-    # Check if this is an error resolution event
-    if not is_error_resolution_event(data):
+    # Check if Heimdall is ready
+    if not is_heimdall_ready():
         sys.exit(0)
 
-    # Extract error info
-    error_info = extract_error_info(data)
+    # Extract error info, if this is an error resolution event
+    error_info = classify_event(data)
     if not error_info:
         sys.exit(0)
 
@@ -220,16 +231,9 @@ def main():
 
     # Add file extension as tech hint
     if error_info.get("file_path"):
-        ext = error_info["file_path"].split(".")[-1] if "." in error_info["file_path"] else ""
-        ext_tech_map = {
-            "ts": "typescript",
-            "tsx": "typescript",
-            "js": "javascript",
-            "jsx": "javascript",
-            "py": "python",
-        }
-        if ext in ext_tech_map and ext_tech_map[ext] not in tech_stack:
-            tech_stack.append(ext_tech_map[ext])
+        ext = os.path.splitext(error_info["file_path"])[1][1:].lower()
+        if ext in EXTENSION_TECH:
+            tech_stack.add(EXTENSION_TECH[ext])
 
     # Generate tags
     additional_tags = ["error-resolution", "debugging"]
@@ -242,8 +246,8 @@ def main():
         additional_tags=additional_tags,
     )
 
-    # Store the memory
-    result = store_memory(
+    # Queue the memory; a background process stores it
+    result = enqueue_memory(
         content=content,
         tags=tags,
         memory_type="error",
@@ -14,6 +14,7 @@ This hook captures:
 
 import sys
 import json
+import re
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
@@ -25,9 +26,30 @@ from .utils import (
     safe_hook_execution,
     log_hook_error,
     is_heimdall_ready,
+    iter_matching_lines,
 )
 
 
+# Phrases that indicate a line records a lesson
+LESSON_INDICATORS = [
+    "learned",
+    "discovered",
+    "found that",
+    "realized",
+    "important to",
+    "should always",
+    "should never",
+    "best practice",
+    "pattern",
+    "solution was",
+    "fixed by",
+    "resolved by",
+]
+
+# Single alternation so the result is scanned once instead of once per phrase
+_LESSON_RE = re.compile("|".join(map(re.escape, LESSON_INDICATORS)), re.IGNORECASE)
+
+
 def extract_agent_info(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Extract agent information from the event data."""
     # SubagentStop event format
@@ -50,32 +72,15 @@ def extract_lessons_from_result(result: str) -> List[str]:
     """Extract potential lessons from agent result."""
     lessons = []
 
-    # Look for common patterns indicating lessons
-    lesson_indicators = [
-        "learned",
-        "discovered",
-        "found that",
-        "realized",
-        "important to",
-        "should always",
-        "should never",
-        "best practice",
-        "pattern",
-        "solution was",
-        "fixed by",
-        "resolved by",
-    ]
-
-    lines = result.split("\n")
-    for line in lines:
-        line_lower = line.lower()
-        if any(indicator in line_lower for indicator in lesson_indicators):
-            # Clean up the line
-            clean_line = line.strip()
-            if clean_line and len(clean_line) > 20:
-                lessons.append(clean_line)
+    for line in iter_matching_lines(result, _LESSON_RE):
+        # Clean up the line
+        clean_line = line.strip()
+        if clean_line and len(clean_line) > 20:
+            lessons.append(clean_line)
+            if len(lessons) == 5:  # Return top 5 lessons
+                break
 
-    return lessons[:5]  # Return top 5 lessons
+    return lessons
 
 
 def create_agent_memory_content(agent_info: Dict[str, Any]) -> str:
@@ -99,8 +104,7 @@ def create_agent_memory_content(agent_info: Dict[str, Any]) -> str:
             content_parts.extend([
                 "## Key Insights",
             ])
-            for lesson in lessons:
-                content_parts.append(f"- {lesson[:200]}")
+            content_parts.extend(f"- {lesson[:200]}" for lesson in lessons)
             content_parts.append("")
 
         # Add summary of result (truncated)
@@ -16,6 +16,7 @@ import sys
 import subprocess
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 
 from .utils import (
@@ -25,10 +26,38 @@ from .utils import (
     safe_hook_execution,
     log_hook_error,
     is_heimdall_ready,
-    get_project_name,
 )
 
 
+# File extensions per category (checked after test markers)
+DOCS_EXTENSIONS = frozenset({".md", ".txt", ".rst"})
+CONFIG_EXTENSIONS = frozenset({".json", ".yaml", ".yml", ".toml", ".ini", ".env"})
+SOURCE_EXTENSIONS = frozenset({".ts", ".tsx", ".js", ".jsx", ".py", ".go", ".rs"})
+
+# Test markers and the extension categories as case-insensitive regexes, so
+# classifying a path never lowercases a copy of it
+_TEST_PATH_RE = re.compile(r"test|\.spec\.", re.IGNORECASE | re.ASCII)
+_EXTENSION_CATEGORY_RE = re.compile(
+    "|".join(
+        f"(?P<{category}>{'|'.join(map(re.escape, sorted(extensions)))})$"
+        for category, extensions in (
+            ("docs", DOCS_EXTENSIONS),
+            ("config", CONFIG_EXTENSIONS),
+            ("source", SOURCE_EXTENSIONS),
+        )
+    ),
+    re.IGNORECASE | re.ASCII,
+)
+
+# Task ID references in commit messages: "task 1.2", "#123", "TM-456", "(task 7)"
+TASK_ID_PATTERNS = [
+    re.compile(r"task\s+(\d+(?:\.\d+)?)", re.IGNORECASE),
+    re.compile(r"#(\d+)", re.IGNORECASE),
+    re.compile(r"TM-(\d+)", re.IGNORECASE),
+    re.compile(r"\(task\s+(\d+(?:\.\d+)?)\)", re.IGNORECASE),
+]
+
+
 def get_last_commit_info() -> Optional[Dict[str, Any]]:
     """Get information about the last commit."""
     try:
@@ -94,23 +123,21 @@ def get_last_commit_info() -> Optional[Dict[str, Any]]:
 
 
 def extract_task_ids(message: str) -> List[str]:
-    """Extract task IDs from commit message."""
-    # Common patterns: "task 1.2", "#123", "TM-456", "(task 7)"
-    patterns = [
-        r"task\s+(\d+(?:\.\d+)?)",
-        r"#(\d+)",
-        r"TM-(\d+)",
-        r"\(task\s+(\d+(?:\.\d+)?)\)",
-    ]
+    """Extract task IDs from commit message, deduplicated in first-seen order."""
+    task_ids = dict.fromkeys(
+        task_id for regex in TASK_ID_PATTERNS for task_id in regex.findall(message)
+    )
+    return list(task_ids)
 
-    task_ids = []
-    message_lower = message.lower()
 
-    for pattern in patterns:
-        matches = re.findall(pattern, message_lower, re.IGNORECASE)
-        task_ids.extend(matches)
+@lru_cache(maxsize=4096)
+def categorize_file(file: str) -> str:
+    """Return the category name for a single file path."""
+    if _TEST_PATH_RE.search(file):
+        return "test"
 
-    return list(set(task_ids))
+    match = _EXTENSION_CATEGORY_RE.search(file)
+    return match.lastgroup if match else "other"
 
 
 def categorize_files(files: List[str]) -> Dict[str, List[str]]:
@@ -124,17 +151,7 @@ def categorize_files(files: List[str]) -> Dict[str, List[str]]:
     }
 
     for file in files:
-        file_lower = file.lower()
-        if "test" in file_lower or ".test." in file_lower or ".spec." in file_lower:
-            categories["test"].append(file)
-        elif file_lower.endswith((".md", ".txt", ".rst")):
-            categories["docs"].append(file)
-        elif file_lower.endswith((".json", ".yaml", ".yml", ".toml", ".ini", ".env")):
-            categories["config"].append(file)
-        elif file_lower.endswith((".ts", ".tsx", ".js", ".jsx", ".py", ".go", ".rs")):
-            categories["source"].append(file)
-        else:
-            categories["other"].append(file)
+        categories[categorize_file(file)].append(file)
 
     return categories
 
@@ -160,8 +177,8 @@ def create_commit_memory_content(commit_info: Dict[str, Any]) -> str:
         for category, cat_files in categories.items():
             if cat_files:
                 content_parts.append(f"\n### {category.title()} ({len(cat_files)})")
-                for f in cat_files[:10]:  # Limit to 10 per category
-                    content_parts.append(f"- {f}")
+                # Limit to 10 per category
+                content_parts.extend(f"- {f}" for f in cat_files[:10])
                 if len(cat_files) > 10:
                     content_parts.append(f"- ... and {len(cat_files) - 10} more")
 
@@ -13,7 +13,6 @@ This hook captures:
 """
 
 import sys
-import json
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -104,11 +103,8 @@ def create_task_memory_content(task_info: Dict[str, str]) -> str:
 @safe_hook_execution
 def main():
     """Main hook execution."""
-    # Check if Heimdall is ready
-    if not is_heimdall_ready():
-        sys.exit(0)
-
-    # Parse input
+    # Parse input; the cheap event filter runs before the Heimdall
+    # readiness check, which may have to spawn the CLI
     data = parse_hook_input()
     if not data:
         sys.exit(0)
@@ -117,6 +113,10 @@ def main():
     if not is_task_completion_event(data):
         sys.exit(0)
 
+    # Check if Heimdall is ready
+    if not is_heimdall_ready():
+        sys.exit(0)
+
     # Extract task info
     task_info = extract_task_info(data)
     if not task_info:
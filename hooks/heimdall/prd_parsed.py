@@ -13,8 +13,8 @@ This hook captures:
 """
 
 import sys
-import json
 import os
+import re
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
@@ -27,13 +27,31 @@ from .utils import (
     log_hook_error,
     is_heimdall_ready,
     get_project_name,
+    iter_matching_lines,
 )
 
 
+# Common requirement patterns
+REQUIREMENT_PATTERNS = [
+    "must ",
+    "should ",
+    "will ",
+    "need to ",
+    "required to ",
+    "requirement:",
+    "- [ ]",  # Checkbox items often are requirements
+]
+
+# Single alternation so each line is scanned once instead of once per pattern
+_REQUIREMENT_RE = re.compile("|".join(map(re.escape, REQUIREMENT_PATTERNS)), re.IGNORECASE)
+
+# parse_prd / parse-prd in any case, matched without lowercasing the name
+_PRD_TOOL_RE = re.compile(r"parse[_-]prd", re.IGNORECASE)
+
+
 def is_prd_parsed_event(data: Dict[str, Any]) -> bool:
     """Check if this is a PRD parsing event."""
-    tool_name = data.get("tool_name", "")
-    return "parse_prd" in tool_name.lower() or "parse-prd" in tool_name.lower()
+    return _PRD_TOOL_RE.search(data.get("tool_name", "")) is not None
 
 
 def extract_prd_info(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -81,26 +99,17 @@ def extract_requirements(prd_content: str) -> List[str]:
     """Extract key requirements from PRD content."""
     requirements = []
 
-    # Common requirement patterns
-    patterns = [
-        "must ",
-        "should ",
-        "will ",
-        "need to ",
-        "required to ",
-        "requirement:",
-        "- [ ]",  # Checkbox items often are requirements
-    ]
-
-    lines = prd_content.split("\n")
-    for line in lines:
-        line_lower = line.lower().strip()
-        if any(p in line_lower for p in patterns):
-            clean_line = line.strip()
-            if clean_line and len(clean_line) > 10 and len(clean_line) < 200:
-                requirements.append(clean_line)
+    for line in iter_matching_lines(prd_content, _REQUIREMENT_RE):
+        clean_line = line.strip()
+        # Re-check the stripped line; trailing spaces count in some patterns
+        if not _REQUIREMENT_RE.search(clean_line):
+            continue
+        if len(clean_line) > 10 and len(clean_line) < 200:
+            requirements.append(clean_line)
+            if len(requirements) == 20:  # Return top 20 requirements
+                break
 
-    return requirements[:20]  # Return top 20 requirements
+    return requirements
 
 
 def create_prd_memory_content(prd_info: Dict[str, Any], prd_content: str) -> str:
@@ -126,8 +135,7 @@ def create_prd_memory_content(prd_info: Dict[str, Any], prd_content: str) -> str
         titles = prd_info.get("task_titles", [])
         if titles:
             content_parts.append("### Task Overview")
-            for i, title in enumerate(titles[:15], 1):
-                content_parts.append(f"{i}. {title}")
+            content_parts.extend(f"{i}. {title}" for i, title in enumerate(titles[:15], 1))
             if len(titles) > 15:
                 content_parts.append(f"... and {len(titles) - 15} more tasks")
             content_parts.append("")
@@ -138,8 +146,7 @@ def create_prd_memory_content(prd_info: Dict[str, Any], prd_content: str) -> str
         content_parts.extend([
             "## Key Requirements",
         ])
-        for req in requirements[:10]:
-            content_parts.append(f"- {req}")
+        content_parts.extend(f"- {req}" for req in requirements[:10])
         content_parts.append("")
 
     # Add PRD content summary
@@ -164,11 +171,8 @@ def create_prd_memory_content(prd_info: Dict[str, Any], prd_content: str) -> str
 @safe_hook_execution
 def main():
     """Main hook execution."""
-    # Check if Heimdall is ready
-    if not is_heimdall_ready():
-        sys.exit(0)
-
-    # Parse input
+    # Parse input; the cheap event filter runs before the Heimdall
+    # readiness check, which may have to spawn the CLI
     data = parse_hook_input()
     if not data:
         sys.exit(0)
@@ -177,6 +181,10 @@ def main():
     if not is_prd_parsed_event(data):
         sys.exit(0)
 
+    # Check if Heimdall is ready
+    if not is_heimdall_ready():
+        sys.exit(0)
+
     # Extract PRD info
     prd_info = extract_prd_info(data)
     if not prd_info:
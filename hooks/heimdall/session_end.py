@@ -15,8 +15,9 @@ This hook captures:
 import sys
 import json
 import os
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Optional
 
 from .utils import (
     store_memory,
@@ -120,11 +121,9 @@ def create_session_memory_content(summary: Dict[str, Any]) -> str:
             "",
             "## Tools Used",
         ])
-        tool_counts = {}
-        for tool in tools:
-            tool_counts[tool] = tool_counts.get(tool, 0) + 1
-        for tool, count in sorted(tool_counts.items(), key=lambda x: -x[1])[:10]:
-            content_parts.append(f"- {tool}: {count}x")
+        # Counter tallies in C and most_common(10) keeps only the top
+        # entries instead of sorting every distinct tool
+        content_parts.extend(f"- {tool}: {count}x" for tool, count in Counter(tools).most_common(10))
 
     # Files modified
     files = summary.get("files_modified", [])
@@ -133,8 +132,7 @@ def create_session_memory_content(summary: Dict[str, Any]) -> str:
             "",
             f"## Files Modified ({len(files)})",
         ])
-        for f in files[:15]:
-            content_parts.append(f"- {f}")
+        content_parts.extend(f"- {f}" for f in files[:15])
         if len(files) > 15:
             content_parts.append(f"- ... and {len(files) - 15} more")
 
@@ -157,8 +155,7 @@ def create_session_memory_content(summary: Dict[str, Any]) -> str:
             "",
             "## Key Activities",
         ])
-        for activity in activities[:10]:
-            content_parts.append(f"- {activity}")
+        content_parts.extend(f"- {activity}" for activity in activities[:10])
 
     return "\n".join(content_parts)
 
@@ -11,16 +11,16 @@ This hook:
 - Displays relevant context to the agent
 """
 
+import io
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TextIO
 
 from .utils import (
     query_memories,
     get_project_name,
     safe_hook_execution,
-    log_hook_error,
     is_heimdall_ready,
     construct_tag,
 )
@@ -59,32 +59,29 @@ def load_error_resolutions() -> List[Dict[str, Any]]:
     return result.get("memories", [])
 
 
-def format_memory_summary(memories: List[Dict[str, Any]], title: str) -> str:
-    """Format memories into a readable summary."""
+def format_memory_summary(memories: List[Dict[str, Any]], title: str, out: TextIO):
+    """Write memories as a readable summary to out."""
     if not memories:
-        return ""
+        return
 
-    lines = [
-        f"\n{title}",
-        "-" * len(title),
-    ]
+    print(f"\n{title}", file=out)
+    print("-" * len(title), file=out)
 
     for mem in memories[:5]:
         content = mem.get("content", "")
         # Get first line or first 100 chars
-        preview = content.split("\n")[0][:100]
-        if len(preview) < len(content.split("\n")[0]):
+        first_line = content.partition("\n")[0]
+        preview = first_line[:100]
+        if len(first_line) > 100:
             preview += "..."
 
         mem_type = mem.get("memoryType", "memory")
         relevance = mem.get("relevanceScore", 0)
         relevance_pct = int(relevance * 100) if relevance else 0
 
-        lines.append(f"  [{mem_type}] {preview}")
+        print(f"  [{mem_type}] {preview}", file=out)
         if relevance_pct > 0:
-            lines.append(f"    Relevance: {relevance_pct}%")
-
-    return "\n".join(lines)
+            print(f"    Relevance: {relevance_pct}%", file=out)
 
 
 @safe_hook_execution
@@ -97,10 +94,15 @@ def main():
 
     project_name = get_project_name()
 
-    # Load various memory types
-    project_context = load_project_context(project_name)
-    recent_lessons = load_recent_lessons()
-    error_resolutions = load_error_resolutions()
+    # Load various memory types concurrently; each query is a CLI round-trip
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        project_future = pool.submit(load_project_context, project_name)
+        lessons_future = pool.submit(load_recent_lessons)
+        errors_future = pool.submit(load_error_resolutions)
+
+    project_context = project_future.result()
+    recent_lessons = lessons_future.result()
+    error_resolutions = errors_future.result()
 
     # Only print if we have context to show
     has_context = any([project_context, recent_lessons, error_resolutions])
@@ -108,25 +110,22 @@ def main():
     if not has_context:
         sys.exit(0)
 
-    # Print context summary
-    print("=" * 60)
-    print("HEIMDALL CONTEXT LOADED")
-    print("=" * 60)
-    print(f"\nProject: {project_name}")
-    print(f"Session started: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-
-    if project_context:
-        print(format_memory_summary(project_context, "Project Memories"))
-
-    if recent_lessons:
-        print(format_memory_summary(recent_lessons, "Recent Lessons"))
-
-    if error_resolutions:
-        print(format_memory_summary(error_resolutions, "Error Resolutions"))
-
-    print("\n" + "=" * 60)
-    print("Use `aes-bizzy memory search <query>` for more context")
-    print("=" * 60)
+    # Build the context summary in memory and write it once
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("HEIMDALL CONTEXT LOADED", file=out)
+    print("=" * 60, file=out)
+    print(f"\nProject: {project_name}", file=out)
+    print(f"Session started: {datetime.now().strftime('%Y-%m-%d %H:%M')}", file=out)
+
+    format_memory_summary(project_context, "Project Memories", out)
+    format_memory_summary(recent_lessons, "Recent Lessons", out)
+    format_memory_summary(error_resolutions, "Error Resolutions", out)
+
+    print("\n" + "=" * 60, file=out)
+    print("Use `aes-bizzy memory search <query>` for more context", file=out)
+    print("=" * 60, file=out)
+    sys.stdout.write(out.getvalue())
 
     sys.exit(0)
 
@@ -9,13 +9,19 @@ Shared utilities for Heimdall memory hooks including:
 - Configuration loading
 """
 
-import subprocess
 import json
 import os
+import re
 import sys
+import time
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pathlib import Path
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator, Iterable, Set
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
 
 # ============================================================================
@@ -26,39 +32,73 @@ HEIMDALL_CLI = "aes-bizzy"
 MEMORY_SUBCOMMAND = "memory"
 DEFAULT_TIMEOUT = 30
 
+# How long a health check result is trusted before the CLI is asked again.
+# The result is only cached in projects that already have a .heimdall
+# directory, so checking never leaves one behind elsewhere
+HEALTH_CACHE_TTL = 60
+HEALTH_CACHE_FILE = os.path.join(".heimdall", "health-cache")
+
+# Memories queued by enqueue_memory, one JSON file each, and the lock held
+# by the background process that stores them. Entries are published and
+# claimed by rename, so none is read half-written or taken twice
+PENDING_MEMORIES_DIR = os.path.join(".heimdall", "pending-memories")
+FLUSH_LOCK_FILE = os.path.join(".heimdall", "flush.lock")
+
+# The flusher waits this long so a burst of events is stored in one run, and
+# a lock untouched for FLUSH_LOCK_STALE seconds is taken to be abandoned
+FLUSH_DELAY = 0.2
+FLUSH_LOCK_STALE = 120
+
+
+# Files or directories that mark a project root
+PROJECT_MARKERS = (".git", "package.json", ".beads", ".taskmaster")
 
-def get_project_root() -> Path:
-    """Get the project root directory."""
-    # Start from current directory and walk up
-    current = Path.cwd()
 
-    # Look for common project markers
-    markers = [".git", "package.json", ".beads", ".taskmaster"]
+def _find_project_root() -> str:
+    """Return the project root for the cwd, computed once per directory."""
+    return _project_root_for(os.getcwd())
 
-    while current != current.parent:
-        for marker in markers:
-            if (current / marker).exists():
-                return current
-        current = current.parent
 
-    return Path.cwd()
+@lru_cache(maxsize=16)
+def _project_root_for(cwd: str) -> str:
+    """Walk up from cwd using plain strings, avoiding Path allocations."""
+    current = cwd
+
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:
+            return cwd
+        # A stat per marker; listing each level would be slow in large
+        # directories such as $HOME, and would count dangling symlinks
+        if any(os.path.exists(os.path.join(current, marker)) for marker in PROJECT_MARKERS):
+            return current
+        current = parent
+
+
+def get_project_root() -> str:
+    """Get the project root directory."""
+    return _find_project_root()
 
 
 def get_project_name() -> str:
     """Get the current project name."""
-    root = get_project_root()
+    return _project_name_for(_find_project_root())
+
+
+@lru_cache(maxsize=16)
+def _project_name_for(root: str) -> str:
+    """Read the project name for a root once; package.json wins over the dir name."""
+    root_name = os.path.basename(root)
 
     # Try package.json first
-    pkg_path = root / "package.json"
-    if pkg_path.exists():
-        try:
-            with open(pkg_path) as f:
-                pkg = json.load(f)
-                return pkg.get("name", root.name)
-        except (json.JSONDecodeError, IOError):
-            pass
+    try:
+        with open(os.path.join(root, "package.json")) as f:
+            pkg = json.load(f)
+            return pkg.get("name", root_name)
+    except (json.JSONDecodeError, IOError):
+        pass
 
-    return root.name
+    return root_name
 
 
 # ============================================================================
@@ -87,6 +127,7 @@ def store_memory(
     Returns:
         Dict with success status and optional memory_id or error
     """
+    import subprocess
     try:
         args = [
             HEIMDALL_CLI, MEMORY_SUBCOMMAND, "store",
@@ -127,6 +168,136 @@ def store_memory(
         return {"success": False, "error": str(e)}
 
 
+def enqueue_memory(**memory: Any) -> Dict[str, Any]:
+    """
+    Queue a memory for store_memory in a background process.
+
+    Takes the same keyword arguments as store_memory. The hook only pays for
+    one small file write; if that fails, the memory is stored inline.
+    Success means the memory was queued: store failures are only logged by
+    the flusher, under "memory_flush".
+    """
+    root = _find_project_root()
+    try:
+        queue_dir = os.path.join(root, PENDING_MEMORIES_DIR)
+        os.makedirs(queue_dir, exist_ok=True)
+        name = f"{time.time_ns()}-{os.getpid()}"
+        tmp_path = os.path.join(queue_dir, name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(memory, f)
+        os.replace(tmp_path, os.path.join(queue_dir, name + ".json"))
+    except OSError:
+        return store_memory(**memory)
+
+    # The entry is visible before the lock is tried, so a flusher that holds
+    # the lock now will see it on its final check
+    _spawn_memory_flusher(root)
+    return {"success": True, "queued": True}
+
+
+def _acquire_flush_lock(lock_path: str) -> bool:
+    """Create the flush lock, replacing it if its holder looks abandoned."""
+    for _ in range(2):
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(lock_path).st_mtime < FLUSH_LOCK_STALE:
+                    return False
+                os.remove(lock_path)
+            except OSError:
+                return False
+        except OSError:
+            return False
+    return False
+
+
+def _spawn_memory_flusher(root: str):
+    """Start a detached flusher unless one is already running for root."""
+    lock_path = os.path.join(root, FLUSH_LOCK_FILE)
+    if not _acquire_flush_lock(lock_path):
+        return
+
+    import subprocess
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--flush-memories", root],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+def _pending_memory_names() -> List[str]:
+    """Queued and previously claimed entry names, oldest first."""
+    try:
+        names = os.listdir(PENDING_MEMORIES_DIR)
+    except OSError:
+        return []
+    return sorted(name for name in names if name.endswith((".json", ".claimed")))
+
+
+def flush_pending_memories():
+    """Store every queued memory, then release the flush lock (run from root)."""
+    time.sleep(FLUSH_DELAY)
+    try:
+        # Keep going until the queue stays empty, so memories queued while
+        # others were being stored are not left behind. An entry claimed by
+        # a flusher that died is stored again; it may be stored twice, but
+        # an entry is only deleted once store_memory has returned
+        while True:
+            names = _pending_memory_names()
+            if not names:
+                break
+
+            for name in names:
+                path = os.path.join(PENDING_MEMORIES_DIR, name)
+                if name.endswith(".json"):
+                    claimed_path = path[:-len(".json")] + ".claimed"
+                    try:
+                        os.replace(path, claimed_path)
+                    except OSError:
+                        continue
+                else:
+                    claimed_path = path
+
+                try:
+                    with open(claimed_path) as f:
+                        memory = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    log_hook_error("memory_flush", f"Unreadable queued memory {name}: {e}")
+                    memory = None
+
+                if memory is not None:
+                    result = store_memory(**memory)
+                    if not result.get("success"):
+                        log_hook_error("memory_flush", result.get("error", "Unknown error"))
+
+                try:
+                    os.remove(claimed_path)
+                    os.utime(FLUSH_LOCK_FILE)  # Still alive
+                except OSError:
+                    pass
+    finally:
+        try:
+            os.remove(FLUSH_LOCK_FILE)
+        except OSError:
+            pass
+
+    # A hook that queued a memory while the lock was still held spawned no
+    # flusher; its entry was published before it tried the lock, so it is
+    # seen here. Entries queued after the release start their own flusher
+    if _pending_memory_names():
+        _spawn_memory_flusher(os.getcwd())
+
+
 def query_memories(
     query: str,
     limit: int = 5,
@@ -145,6 +316,7 @@ def query_memories(
     Returns:
         Dict with success status and memories or error
     """
+    import subprocess
     try:
         args = [
             HEIMDALL_CLI, MEMORY_SUBCOMMAND, "search",
@@ -182,8 +354,9 @@ def query_memories(
         return {"success": False, "error": str(e), "memories": []}
 
 
-def is_heimdall_ready() -> bool:
-    """Check if Heimdall is initialized and ready."""
+def _check_heimdall_health() -> bool:
+    """Ask the Heimdall CLI whether memory storage is operational."""
+    import subprocess
     try:
         result = subprocess.run(
             [HEIMDALL_CLI, MEMORY_SUBCOMMAND, "health", "--json"],
@@ -199,6 +372,30 @@ def is_heimdall_ready() -> bool:
     return False
 
 
+def is_heimdall_ready() -> bool:
+    """Check if Heimdall is initialized and ready."""
+    # Every Heimdall hook asks this first; a fresh cached answer costs one
+    # stat and read instead of spawning the CLI
+    cache_path = os.path.join(_find_project_root(), HEALTH_CACHE_FILE)
+    try:
+        if time.time() - os.stat(cache_path).st_mtime < HEALTH_CACHE_TTL:
+            with open(cache_path) as f:
+                return f.read() == "1"
+    except OSError:
+        pass
+
+    ready = _check_heimdall_health()
+    if not os.path.isdir(os.path.dirname(cache_path)):
+        return ready
+    try:
+        with open(cache_path, "w") as f:
+            f.write("1" if ready else "0")
+    except OSError:
+        pass  # Caching is best-effort
+
+    return ready
+
+
 # ============================================================================
 # Tag Generation
 # ============================================================================
@@ -218,6 +415,9 @@ TAG_PREFIXES = {
 }
 
 
+# Tag construction is pure and sees the same few values (agent, project,
+# tech names) on every call, so results are memoized
+@lru_cache(maxsize=512)
 def normalize_tag(tag: str) -> str:
     """Normalize a tag (lowercase, replace spaces, remove special chars)."""
     return (
@@ -228,6 +428,7 @@ def normalize_tag(tag: str) -> str:
     )
 
 
+@lru_cache(maxsize=512)
 def construct_tag(prefix_key: str, value: str) -> str:
     """Construct a prefixed tag."""
     prefix = TAG_PREFIXES.get(prefix_key, "")
@@ -239,7 +440,7 @@ def generate_standard_tags(
     task_id: Optional[str] = None,
     memory_type: Optional[str] = None,
     project_name: Optional[str] = None,
-    tech_stack: Optional[List[str]] = None,
+    tech_stack: Optional[Iterable[str]] = None,
     additional_tags: Optional[List[str]] = None,
 ) -> List[str]:
     """
@@ -250,7 +451,7 @@ def generate_standard_tags(
         task_id: Task identifier
         memory_type: Type of memory
         project_name: Project name
-        tech_stack: List of technologies
+        tech_stack: Technologies, emitted in sorted order
         additional_tags: Additional custom tags
 
     Returns:
@@ -276,39 +477,65 @@ def generate_standard_tags(
             tags.append(construct_tag("PROJECT", detected))
 
     if tech_stack:
-        for tech in tech_stack:
+        for tech in sorted(tech_stack):
             tags.append(construct_tag("TECH", tech))
 
     if additional_tags:
+        seen = set(tags)
         for tag in additional_tags:
             normalized = normalize_tag(tag)
-            if normalized and normalized not in tags:
+            if normalized and normalized not in seen:
+                seen.add(normalized)
                 tags.append(normalized)
 
     return tags
 
 
-def extract_tech_from_content(content: str) -> List[str]:
-    """Extract technology tags from content."""
-    tech_patterns = {
-        "typescript": ["typescript", ".ts", "tsc"],
-        "javascript": ["javascript", ".js", "node"],
-        "python": ["python", ".py", "pip"],
-        "react": ["react", "jsx", "tsx", "usestate", "useeffect"],
-        "docker": ["docker", "dockerfile", "container"],
-        "postgres": ["postgres", "postgresql", "psql"],
-        "supabase": ["supabase", "@supabase"],
-        "qdrant": ["qdrant", "vector", "embedding"],
-    }
+# Technology keywords detected in memory content
+TECH_PATTERNS = {
+    "typescript": ("typescript", ".ts", "tsc"),
+    "javascript": ("javascript", ".js", "node"),
+    "python": ("python", ".py", "pip"),
+    "react": ("react", "jsx", "tsx", "usestate", "useeffect"),
+    "docker": ("docker", "dockerfile", "container"),
+    "postgres": ("postgres", "postgresql", "psql"),
+    "supabase": ("supabase", "@supabase"),
+    "qdrant": ("qdrant", "vector", "embedding"),
+}
+
+
+# Every keyword mapped to its technology, scanned in a single pass. The
+# lookahead makes matches zero-width so overlapping keywords are all seen;
+# only one keyword can match per start position, so no technology's
+# keyword may be a prefix of another technology's keyword. Matching is
+# ASCII case-insensitive so the content is never copied by lower()
+_TECH_KEYWORDS = {
+    keyword: tech for tech, keywords in TECH_PATTERNS.items() for keyword in keywords
+}
+_TECH_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_TECH_KEYWORDS, key=len, reverse=True)) + "))",
+    re.IGNORECASE | re.ASCII,
+)
 
-    detected = []
-    content_lower = content.lower()
 
-    for tech, patterns in tech_patterns.items():
-        if any(p in content_lower for p in patterns):
-            detected.append(tech)
+def extract_tech_from_content(content: str) -> Set[str]:
+    """Extract technology tags from content."""
+    return {_TECH_KEYWORDS[m.group(1).lower()] for m in _TECH_RE.finditer(content)}
+
 
-    return detected
+def iter_matching_lines(text: str, regex: re.Pattern) -> Iterator[str]:
+    """Yield the lines of text that regex matches, scanning the text once."""
+    pos = 0
+    while True:
+        match = regex.search(text, pos)
+        if not match:
+            return
+        start = text.rfind("\n", 0, match.start()) + 1
+        end = text.find("\n", match.start())
+        if end == -1:
+            end = len(text)
+        yield text[start:end]
+        pos = end + 1
 
 
 # ============================================================================
@@ -329,10 +556,10 @@ def log_hook_error(hook_name: str, error: str, context: Optional[Dict] = None):
     print(f"[Heimdall Hook Error] {hook_name}: {error}", file=sys.stderr)
 
     # Optionally write to log file
-    log_dir = get_project_root() / ".heimdall" / "logs"
+    log_dir = os.path.join(get_project_root(), ".heimdall", "logs")
     try:
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / "hook-errors.jsonl"
+        os.makedirs(log_dir, exist_ok=True)
+        log_file = os.path.join(log_dir, "hook-errors.jsonl")
         with open(log_file, "a") as f:
             f.write(json.dumps(log_entry) + "\n")
     except Exception:
@@ -355,19 +582,99 @@ def safe_hook_execution(func):
 # Input Parsing
 # ============================================================================
 
+def _loads(data):
+    """Parse JSON text or bytes, via orjson when available."""
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. escaped lone surrogates; stdlib accepts them
+    return json.loads(data)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize to compact JSON text, via orjson when available."""
+    if orjson:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates; stdlib escapes them
+    return json.dumps(obj)
+
+
 def parse_hook_input() -> Dict[str, Any]:
     """Parse JSON input from stdin (common hook pattern)."""
     try:
         input_data = sys.stdin.read()
         if not input_data.strip():
             return {}
-        return json.loads(input_data)
+        return _loads(input_data)
     except json.JSONDecodeError:
         return {}
     except Exception:
         return {}
 
 
+# How much of stdin is read before deciding whether an event is wanted
+HOOK_INPUT_PEEK_BYTES = 65_536
+
+# JSON string literals and brackets, enough to track nesting depth
+_JSON_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+_JSON_STRING_VALUE_RE = re.compile(rb'\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+def _peek_tool_name(head: bytes) -> Optional[str]:
+    """Find the top-level tool_name in the start of a JSON object, if present."""
+    depth = 0
+    for match in _JSON_TOKEN_RE.finditer(head):
+        token = match.group()
+        if token in (b"{", b"["):
+            depth += 1
+        elif token in (b"}", b"]"):
+            depth -= 1
+        elif depth == 1 and token == b'"tool_name"':
+            value = _JSON_STRING_VALUE_RE.match(head, match.end())
+            if value:
+                return json.loads(value.group(1))
+    return None
+
+
+def parse_hook_input_for_tools(tools: frozenset) -> Dict[str, Any]:
+    """
+    Parse stdin like parse_hook_input, but only for events from the given tools.
+
+    The tool name is peeked from the head of the payload; other tools' events
+    (which can carry multi-MB results) are drained undecoded and yield {}.
+    """
+    try:
+        stdin = sys.stdin.buffer
+        head = stdin.read(HOOK_INPUT_PEEK_BYTES)
+
+        if len(head) == HOOK_INPUT_PEEK_BYTES:
+            tool_name = _peek_tool_name(head)
+            if tool_name is not None and tool_name not in tools:
+                # Keep reading so the writer never sees a closed pipe
+                while stdin.read(HOOK_INPUT_PEEK_BYTES):
+                    pass
+                return {}
+            head += stdin.read()
+
+        if not head.strip():
+            return {}
+        data = _loads(head)
+    except Exception:
+        return {}
+
+    if not isinstance(data, dict) or data.get("tool_name") not in tools:
+        return {}
+    return data
+
+
 def get_env_or_default(key: str, default: str = "") -> str:
     """Get environment variable with default."""
     return os.environ.get(key, default)
+
+
+if __name__ == "__main__" and sys.argv[1:2] == ["--flush-memories"]:
+    os.chdir(sys.argv[2])
+    flush_pending_memories()
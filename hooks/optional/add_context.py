@@ -16,6 +16,19 @@ import sys
 import subprocess
 import os
 
+# hooks/utils is imported as the utils package from the hooks directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The in-progress task is cached per project and reused until Beads' own data
+# in .beads changes, so idle tool calls skip spawning `bd`. Only a local .beads
+# can be fingerprinted; a database found through BEADS_DB or in a parent
+# directory is always queried
+CACHE_NAME = "add-context"
+
+# Files in .beads written by Beads itself; hooks keep their logs alongside
+BEADS_DATA_SUFFIXES = (".db", ".db-wal", ".jsonl")
+BEADS_DATA_JSONL = frozenset({"issues.jsonl", "deletions.jsonl"})
+
 
 def run_beads_command(args: list[str]) -> dict | None:
     """Execute a Beads CLI command and return parsed JSON output."""
@@ -33,6 +46,58 @@ def run_beads_command(args: list[str]) -> dict | None:
     return None
 
 
+def is_beads_data_file(name: str) -> bool:
+    """Check whether a file in .beads holds Beads' own task data."""
+    if name.endswith(".jsonl"):
+        return name in BEADS_DATA_JSONL
+    return name.endswith(BEADS_DATA_SUFFIXES)
+
+
+def beads_signature() -> list:
+    """Fingerprint Beads' database and issue files by name, mtime and size."""
+    signature = []
+    try:
+        entries = os.scandir(".beads")
+    except OSError:
+        return signature
+    with entries:
+        for entry in entries:
+            if not is_beads_data_file(entry.name):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            signature.append([entry.name, st.st_mtime_ns, st.st_size])
+    return sorted(signature)
+
+
+def get_current_task() -> dict | None:
+    """Get the first in-progress task from Beads."""
+    tasks = run_beads_command(["list", "--status", "in_progress", "--json"])
+    if tasks and "tasks" in tasks and tasks["tasks"]:
+        return {
+            "id": tasks["tasks"][0].get("id"),
+            "title": tasks["tasks"][0].get("title"),
+            "status": tasks["tasks"][0].get("status")
+        }
+    return None
+
+
+def cached_current_task() -> dict | None:
+    """Get the current task, skipping `bd` when .beads is unchanged."""
+    if os.environ.get("BEADS_DB"):
+        return get_current_task()
+    signature = beads_signature()
+    if not signature:
+        return get_current_task()
+
+    from utils.common import cached_by_digest
+    return cached_by_digest(
+        CACHE_NAME, os.path.abspath(".beads"), json.dumps(signature), get_current_task,
+    )
+
+
 def get_current_context() -> dict:
     """Gather current context from Beads."""
     context = {
@@ -42,13 +107,7 @@ def get_current_context() -> dict:
     }
 
     # Get current/in-progress task
-    tasks = run_beads_command(["list", "--status", "in_progress", "--json"])
-    if tasks and "tasks" in tasks and tasks["tasks"]:
-        context["current_task"] = {
-            "id": tasks["tasks"][0].get("id"),
-            "title": tasks["tasks"][0].get("title"),
-            "status": tasks["tasks"][0].get("status")
-        }
+    context["current_task"] = cached_current_task()
 
     # Get project metadata if available
     meta_path = ".beads/project-meta.json"
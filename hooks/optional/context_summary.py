@@ -12,10 +12,12 @@ Summary Includes:
 - Pending items
 """
 
+import io
 import json
 import sys
 import subprocess
 import os
+from collections import defaultdict
 from datetime import datetime
 
 
@@ -37,20 +39,17 @@ def run_beads_command(args: list[str]) -> dict | None:
 
 def get_session_tasks() -> list[dict]:
     """Get tasks that were worked on in this session."""
-    tasks = []
+    tasks = run_beads_command(["list", "--json"])
+    if not tasks or "tasks" not in tasks:
+        return []
 
-    # Get in-progress tasks
-    in_progress = run_beads_command(["list", "--status", "in_progress", "--json"])
-    if in_progress and "tasks" in in_progress:
-        tasks.extend(in_progress["tasks"])
+    # One listing, bucketed by status
+    by_status = defaultdict(list)
+    for task in tasks["tasks"]:
+        by_status[task.get("status", "")].append(task)
 
-    # Get recently done tasks
-    done = run_beads_command(["list", "--status", "done", "--json"])
-    if done and "tasks" in done:
-        # Filter to recent ones (would need timestamp)
-        tasks.extend(done["tasks"][:3])
-
-    return tasks
+    # Recently done tasks (would need timestamp to filter properly)
+    return by_status["in_progress"] + by_status["done"][:3]
 
 
 def get_modified_files() -> list[str]:
@@ -125,27 +124,29 @@ def main():
     summary = generate_summary()
     save_summary(summary)
 
-    # Print summary for user
-    print("=" * 60)
-    print("SESSION SUMMARY")
-    print("=" * 60)
+    # Print summary for user, built in one buffer and written once
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("SESSION SUMMARY", file=out)
+    print("=" * 60, file=out)
 
     if summary["tasks_worked_on"]:
-        print("\nTasks Worked On:")
+        print("\nTasks Worked On:", file=out)
         for task in summary["tasks_worked_on"]:
-            print(f"  [{task['id']}] {task['title']} ({task['status']})")
+            print(f"  [{task['id']}] {task['title']} ({task['status']})", file=out)
 
     if summary["files_modified"]:
-        print(f"\nFiles Modified ({len(summary['files_modified'])}):")
+        print(f"\nFiles Modified ({len(summary['files_modified'])}):", file=out)
         for f in summary["files_modified"][:5]:
-            print(f"  {f}")
+            print(f"  {f}", file=out)
 
     if summary["pending_items"]:
-        print("\nPending Items:")
+        print("\nPending Items:", file=out)
         for item in summary["pending_items"]:
-            print(f"  [{item['id']}] {item['title']}")
+            print(f"  [{item['id']}] {item['title']}", file=out)
 
-    print("=" * 60)
+    print("=" * 60, file=out)
+    sys.stdout.write(out.getvalue())
 
     sys.exit(0)
 
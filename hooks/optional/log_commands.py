@@ -14,8 +14,34 @@ Features:
 import json
 import sys
 import os
+from collections import deque
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def _loads(line: bytes) -> dict:
+    """Parse one JSON line, via orjson when available."""
+    if orjson:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # e.g. escaped lone surrogates; stdlib accepts them
+    return json.loads(line)
+
+
+def _dumps_line(entry: dict) -> bytes:
+    """Serialize a log entry as one JSON line, via orjson when available."""
+    if orjson:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates in a command; stdlib escapes them
+    return (json.dumps(entry) + "\n").encode()
+
 
 def log_command(command: str, status: str, output: str = ""):
     """Log a command execution."""
@@ -33,8 +59,8 @@ def log_command(command: str, status: str, output: str = ""):
     }
 
     try:
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        with open(log_file, "ab") as f:
+            f.write(_dumps_line(entry))
     except IOError:
         pass
 
@@ -53,11 +79,12 @@ def get_recent_commands(count: int = 10) -> list[dict]:
         return commands
 
     try:
-        with open(log_file, "r") as f:
-            lines = f.readlines()
-            for line in lines[-count:]:
+        with open(log_file, "rb") as f:
+            # Stream the file keeping only the tail, so memory stays bounded
+            lines = deque(f, maxlen=count)
+            for line in lines:
                 try:
-                    commands.append(json.loads(line))
+                    commands.append(_loads(line))
                 except json.JSONDecodeError:
                     pass
     except IOError:
@@ -15,46 +15,103 @@ import json
 import sys
 import re
 import os
+from functools import lru_cache
+
+# hooks/utils is imported as the utils package from the hooks directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Writes and edits whose resulting file gets a quality pass
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Decision points counted toward cyclomatic complexity
+DECISION_PATTERNS = [
+    r"\bif\b",
+    r"\belse\b",
+    r"\belif\b",
+    r"\bfor\b",
+    r"\bwhile\b",
+    r"\bcase\b",
+    r"\bcatch\b",
+    r"\b\?\s*:",  # ternary
+    r"\b&&\b",
+    r"\b\|\|\b",
+]
+
+# The patterns never overlap, so one pass over the alternation yields the
+# same total as running each pattern separately
+_DECISION_RE = re.compile("|".join(DECISION_PATTERNS))
+
+# Files larger than this are only scanned in a head and tail window
+MAX_SCAN_CHARS = 256_000
+SCAN_WINDOW = 65_536
+
+_EXPORT_RE = re.compile(r"export\s+(?:function|const|class)")
+
+# Lines that open a function body (simplified)
+_FUNCTION_START_RE = re.compile(r"(function\s+\w+|=>\s*\{|\)\s*\{)")
+
+# Source files this hook checks; str.endswith takes the tuple directly
+SOURCE_SUFFIXES = (".ts", ".js", ".tsx", ".jsx", ".py")
+
+# Path fragments marking test files
+TEST_FILE_MARKERS = (".test.", ".spec.", "__tests__")
+
+_TEST_FILE_RE = re.compile("|".join(map(re.escape, TEST_FILE_MARKERS)))
+
+# Sibling test file names for a TypeScript or JavaScript source; either
+# language may hold the tests for the other
+SCRIPT_TEST_FILE_NAMES = ("{stem}.test.ts", "{stem}.spec.ts", "{stem}.test.js", "{stem}.spec.js")
+
+# Source extension -> sibling test file names to look for, one lookup per
+# file; other extensions are checked for the script names
+TEST_FILE_NAMES = {
+    ".tsx": ("{stem}.test.tsx", "{stem}.spec.tsx") + SCRIPT_TEST_FILE_NAMES,
+    ".jsx": ("{stem}.test.jsx", "{stem}.spec.jsx") + SCRIPT_TEST_FILE_NAMES,
+    ".py": ("test_{stem}.py", "{stem}_test.py"),
+}
+
+# Digest cache holding each file's last analysis, so a re-hook on an
+# unchanged file skips the complexity and pattern scans
+CACHE_NAME = "quality-check"
+
+
+@lru_cache(maxsize=4096)
+def classify_path(file_path: str) -> str | None:
+    """Classify a path in one pass: "test", "source", or None if not checked."""
+    if not file_path.endswith(SOURCE_SUFFIXES):
+        return None
+    if _TEST_FILE_RE.search(file_path):
+        return "test"
+    return "source"
 
 
 def calculate_complexity(content: str) -> int:
     """Calculate rough cyclomatic complexity."""
-    # Count decision points
-    decision_patterns = [
-        r"\bif\b",
-        r"\belse\b",
-        r"\belif\b",
-        r"\bfor\b",
-        r"\bwhile\b",
-        r"\bcase\b",
-        r"\bcatch\b",
-        r"\b\?\s*:",  # ternary
-        r"\b&&\b",
-        r"\b\|\|\b",
-    ]
-
     complexity = 1  # Base complexity
-    for pattern in decision_patterns:
-        complexity += len(re.findall(pattern, content))
+    for _ in _DECISION_RE.finditer(content):
+        complexity += 1
 
     return complexity
 
 
+def sample_content(content: str) -> str:
+    """Bound analysis time by sampling the head and tail of huge files."""
+    if len(content) <= MAX_SCAN_CHARS:
+        return content
+    return content[:SCAN_WINDOW] + "\n" + content[-SCAN_WINDOW:]
+
+
 def check_function_size(content: str) -> list[str]:
     """Check for overly large functions."""
     warnings = []
 
-    # Find function definitions and their content
-    # This is a simplified check
-    func_pattern = r"(function\s+\w+|=>\s*\{|\)\s*\{)"
-
     lines = content.split("\n")
     in_function = False
     function_start = 0
     brace_count = 0
 
     for i, line in enumerate(lines):
-        if re.search(func_pattern, line):
+        if _FUNCTION_START_RE.search(line):
             in_function = True
             function_start = i
             brace_count = line.count("{") - line.count("}")
@@ -75,35 +132,57 @@ def check_file_size(content: str, file_path: str) -> list[str]:
     """Check if file is too large."""
     warnings = []
 
-    lines = len(content.split("\n"))
+    lines = content.count("\n") + 1
     if lines > 500:
         warnings.append(f"File has {lines} lines - consider splitting into modules")
 
     return warnings
 
 
+def analyze_content(content: str, file_path: str) -> list[str]:
+    """Run the content-only checks (complexity, function and file size)."""
+    issues = []
+    scan = sample_content(content)
+
+    # Check complexity
+    complexity = calculate_complexity(scan)
+    if complexity > 20:
+        issues.append(f"High complexity score ({complexity}) - consider refactoring")
+
+    # Check function sizes
+    issues.extend(check_function_size(scan))
+
+    # Check file size
+    issues.extend(check_file_size(content, file_path))
+
+    return issues
+
+
+def cached_analyze_content(content: str, file_path: str) -> list[str]:
+    """Analyze content, reusing the previous result when the file is unchanged."""
+    # Imported here, so hooks that exit early never load the shared module
+    from utils.common import cached_by_digest
+    return cached_by_digest(
+        CACHE_NAME, os.path.abspath(file_path), content,
+        lambda: analyze_content(content, file_path),
+    )
+
+
 def suggest_tests(content: str, file_path: str) -> list[str]:
-    """Suggest test coverage if missing."""
+    """Suggest test coverage for a non-test source file if missing."""
     suggestions = []
 
-    # Check if it's a test file
-    if any(p in file_path for p in [".test.", ".spec.", "__tests__"]):
-        return suggestions
-
     # Count exported functions
-    exports = len(re.findall(r"export\s+(function|const|class)", content))
+    exports = sum(1 for _ in _EXPORT_RE.finditer(content))
 
     if exports > 0:
         # Check for corresponding test file
-        base = os.path.splitext(file_path)[0]
-        test_candidates = [
-            f"{base}.test.ts",
-            f"{base}.spec.ts",
-            f"{base}.test.js",
-            f"{base}.spec.js",
-        ]
-
-        has_tests = any(os.path.exists(t) for t in test_candidates)
+        dirname, name = os.path.split(file_path)
+        stem, ext = os.path.splitext(name)
+        has_tests = any(
+            os.path.exists(os.path.join(dirname, template.format(stem=stem)))
+            for template in TEST_FILE_NAMES.get(ext, SCRIPT_TEST_FILE_NAMES)
+        )
         if not has_tests:
             suggestions.append(
                 f"Consider adding tests for {exports} exported function(s)"
@@ -125,13 +204,14 @@ def main():
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {})
 
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
 
     # Only check source files
-    if not any(file_path.endswith(ext) for ext in [".ts", ".js", ".tsx", ".jsx", ".py"]):
+    kind = classify_path(file_path)
+    if kind is None:
         sys.exit(0)
 
     if not os.path.exists(file_path):
@@ -143,21 +223,11 @@ def main():
     except IOError:
         sys.exit(0)
 
-    all_issues = []
-
-    # Check complexity
-    complexity = calculate_complexity(content)
-    if complexity > 20:
-        all_issues.append(f"High complexity score ({complexity}) - consider refactoring")
-
-    # Check function sizes
-    all_issues.extend(check_function_size(content))
-
-    # Check file size
-    all_issues.extend(check_file_size(content, file_path))
+    all_issues = cached_analyze_content(content, file_path)
 
-    # Test suggestions
-    all_issues.extend(suggest_tests(content, file_path))
+    # Test suggestions depend on sibling files, so they are never cached
+    if kind == "source":
+        all_issues.extend(suggest_tests(sample_content(content), file_path))
 
     if all_issues:
         result = {
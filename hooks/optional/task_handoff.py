@@ -18,6 +18,19 @@ import os
 from datetime import datetime
 
 
+# Append-only log of handoffs, one JSON object per line
+HANDOFF_LOG = ".beads/handoff-log.jsonl"
+
+# Task notes queued during this hook run, flushed as one update per task
+_pending_notes: dict[str, list[str]] = {}
+
+# Handoff log entries queued during this hook run, flushed as one append
+_pending_handoffs: list[dict] = []
+
+# Fixed response for handoffs without a target, serialized once at load
+COMPLETED_RESPONSE = json.dumps({"status": "logged", "action": "completed"})
+
+
 def run_beads_command(args: list[str]) -> dict | None:
     """Execute a Beads CLI command and return parsed JSON output."""
     try:
@@ -37,6 +50,36 @@ def run_beads_command(args: list[str]) -> dict | None:
     return None
 
 
+def queue_note(task_id: str, note: str):
+    """Queue a note for a task; sent on the next flush_notes()."""
+    _pending_notes.setdefault(task_id, []).append(note)
+
+
+def flush_notes():
+    """Send queued notes with a single `bd update` per task."""
+    for task_id, notes in _pending_notes.items():
+        run_beads_command(["update", task_id, "--add-note", "\n".join(notes), "--json"])
+    _pending_notes.clear()
+
+
+def flush_handoffs():
+    """Append queued handoff entries to the log in a single write."""
+    if not _pending_handoffs:
+        return
+    try:
+        with open(HANDOFF_LOG, "a") as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in _pending_handoffs))
+    except IOError:
+        pass
+    _pending_handoffs.clear()
+
+
+def flush_outbox():
+    """Flush everything queued during this hook run."""
+    flush_notes()
+    flush_handoffs()
+
+
 def log_handoff(from_agent: str, to_agent: str, task_id: str, context: str):
     """Log a handoff in Beads."""
     timestamp = datetime.now().isoformat()
@@ -55,29 +98,28 @@ def log_handoff(from_agent: str, to_agent: str, task_id: str, context: str):
 
     # Add note to task if provided
     if task_id:
-        note = f"Handoff: {from_agent} -> {to_agent}: {context[:100]}"
-        run_beads_command(["update", task_id, "--add-note", note, "--json"])
+        queue_note(task_id, f"Handoff: {from_agent} -> {to_agent}: {context[:100]}")
 
-    # Append to handoff log file
-    log_path = ".beads/handoff-log.jsonl"
-    try:
-        with open(log_path, "a") as f:
-            f.write(json.dumps(handoff_data) + "\n")
-    except IOError:
-        pass
+    # Queue for the handoff log file
+    _pending_handoffs.append(handoff_data)
 
 
 def get_handoff_chain(task_id: str) -> list[dict]:
     """Get the handoff chain for a task."""
     chain = []
 
-    log_path = ".beads/handoff-log.jsonl"
-    if not os.path.exists(log_path):
+    if not os.path.exists(HANDOFF_LOG):
         return chain
 
+    # Entries are written with json.dumps defaults, so other tasks' lines
+    # can be skipped without decoding them
+    needle = f'"task_id": {json.dumps(task_id)}'
+
     try:
-        with open(log_path, "r") as f:
+        with open(HANDOFF_LOG, "r") as f:
             for line in f:
+                if needle not in line:
+                    continue
                 try:
                     entry = json.loads(line)
                     if entry.get("task_id") == task_id:
@@ -94,11 +136,7 @@ def update_task_assignment(task_id: str, new_agent: str):
     """Update task assignment in Beads."""
     # This would ideally use bd update with --assign flag
     # For now, add a note
-    run_beads_command([
-        "update", task_id,
-        "--add-note", f"Assigned to: {new_agent}",
-        "--json"
-    ])
+    queue_note(task_id, f"Assigned to: {new_agent}")
 
 
 def main():
@@ -124,7 +162,8 @@ def main():
     if not to_agent:
         # No handoff target, just log completion
         log_handoff(from_agent, "completed", task_id, context)
-        print(json.dumps({"status": "logged", "action": "completed"}))
+        flush_outbox()
+        print(COMPLETED_RESPONSE)
     else:
         # Log handoff
         log_handoff(from_agent, to_agent, task_id, context)
@@ -133,6 +172,7 @@ def main():
         if task_id:
             update_task_assignment(task_id, to_agent)
 
+        flush_outbox()
         print(json.dumps({
             "status": "handed_off",
             "from": from_agent,
@@ -15,7 +15,17 @@ import json
 import sys
 import re
 import os
+from functools import lru_cache
+from typing import NamedTuple
 
+# hooks/utils is imported as the utils package from the hooks directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Writes and edits after which API functions must be documented
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Functions past this point in a file are not checked for documentation
+MAX_SCAN_CHARS = 256_000
 
 # Patterns for API files
 API_FILE_PATTERNS = [
@@ -28,53 +38,75 @@ API_FILE_PATTERNS = [
     r"\.api\.",
 ]
 
+_API_FILE_RE = re.compile("|".join(API_FILE_PATTERNS), re.IGNORECASE)
+
+# JS/TS sources that carry JSDoc
+SCRIPT_EXTENSIONS = frozenset({".ts", ".js", ".tsx", ".jsx"})
+
+# Function declarations, compiled once at import
+FUNCTION_PATTERNS = [
+    # export function name(...)
+    re.compile(r"export\s+(async\s+)?function\s+(\w+)\s*\("),
+    # export const name = (...) =>
+    re.compile(r"export\s+const\s+(\w+)\s*=\s*(async\s+)?\([^)]*\)\s*=>"),
+    # public method
+    re.compile(r"(public\s+)?(async\s+)?(\w+)\s*\([^)]*\)\s*[:{]"),
+]
+
+# Modifier groups captured by FUNCTION_PATTERNS that are not names
+NON_NAME_GROUPS = frozenset({"async", "public"})
+
+# How many lines above a function may hold its JSDoc block
+JSDOC_LOOKBACK_LINES = 10
+
+_JSDOC_END_RE = re.compile(r"/\*\*[\s\S]*?\*/\s*$")
+
+# Digest cache of each API file's missing-docs warnings; saving a file
+# unchanged does not re-run the JSDoc lookback for every function
+CACHE_NAME = "api-docs"
+
+
+class FunctionDef(NamedTuple):
+    """A function definition found in the source."""
+    name: str
+    position: int
+    line: int
+
 
+@lru_cache(maxsize=4096)
 def is_api_file(path: str) -> bool:
     """Check if file is an API-related file."""
-    for pattern in API_FILE_PATTERNS:
-        if re.search(pattern, path, re.IGNORECASE):
-            return True
-    return False
+    return _API_FILE_RE.search(path) is not None
 
 
-def extract_functions(content: str) -> list[dict]:
+def extract_functions(content: str) -> list[FunctionDef]:
     """Extract function definitions from code."""
     functions = []
 
-    # Match function declarations
-    patterns = [
-        # export function name(...)
-        r"export\s+(async\s+)?function\s+(\w+)\s*\(",
-        # export const name = (...) =>
-        r"export\s+const\s+(\w+)\s*=\s*(async\s+)?\([^)]*\)\s*=>",
-        # public method
-        r"(public\s+)?(async\s+)?(\w+)\s*\([^)]*\)\s*[:{]",
-    ]
-
-    for pattern in patterns:
-        for match in re.finditer(pattern, content):
+    for pattern in FUNCTION_PATTERNS:
+        for match in pattern.finditer(content):
             # Get function name
             groups = match.groups()
-            name = next((g for g in groups if g and not g.strip() in ["async", "public"]), None)
+            name = next((g for g in groups if g and g.strip() not in NON_NAME_GROUPS), None)
             if name:
-                functions.append({
-                    "name": name.strip(),
-                    "position": match.start(),
-                    "line": content[:match.start()].count("\n") + 1
-                })
+                position = match.start()
+                functions.append(FunctionDef(
+                    name.strip(), position, content.count("\n", 0, position) + 1
+                ))
 
     return functions
 
 
 def has_jsdoc_before(content: str, position: int) -> bool:
     """Check if there's a JSDoc comment before the position."""
-    # Look back from position for /** ... */
-    before = content[:position]
-    lines = before.split("\n")
-
-    # Check last few lines for JSDoc
-    recent = "\n".join(lines[-10:])
-    return bool(re.search(r"/\*\*[\s\S]*?\*/\s*$", recent))
+    # Walk back over the last few lines in place instead of copying and
+    # splitting everything before the function
+    start = position
+    for _ in range(JSDOC_LOOKBACK_LINES):
+        start = content.rfind("\n", 0, start)
+        if start == -1:
+            break
+    return bool(_JSDOC_END_RE.search(content, start + 1, position))
 
 
 def check_documentation(content: str) -> list[str]:
@@ -84,14 +116,23 @@ def check_documentation(content: str) -> list[str]:
     functions = extract_functions(content)
 
     for func in functions:
-        if not has_jsdoc_before(content, func["position"]):
+        if not has_jsdoc_before(content, func.position):
             warnings.append(
-                f"Function '{func['name']}' (line {func['line']}) lacks JSDoc documentation"
+                f"Function '{func.name}' (line {func.line}) lacks JSDoc documentation"
             )
 
     return warnings
 
 
+def cached_check_documentation(content: str, file_path: str) -> list[str]:
+    """Check documentation, reusing the previous result when the file is unchanged."""
+    from utils.common import cached_by_digest
+    return cached_by_digest(
+        CACHE_NAME, os.path.abspath(file_path), content,
+        lambda: check_documentation(content),
+    )
+
+
 def main():
     """Main hook execution."""
     # Read tool input from stdin
@@ -106,17 +147,17 @@ def main():
     tool_input = data.get("tool_input", {})
 
     # Only check after Write/Edit
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
 
-    # Only check API files
-    if not is_api_file(file_path):
+    # Skip non-JS/TS files
+    if os.path.splitext(file_path)[1] not in SCRIPT_EXTENSIONS:
         sys.exit(0)
 
-    # Skip non-JS/TS files
-    if not file_path.endswith((".ts", ".js", ".tsx", ".jsx")):
+    # Only check API files
+    if not is_api_file(file_path):
         sys.exit(0)
 
     # Read file content
@@ -125,12 +166,15 @@ def main():
 
     try:
         with open(file_path, "r") as f:
-            content = f.read()
+            content = f.read(MAX_SCAN_CHARS)
     except IOError:
         sys.exit(0)
 
+    if not content:
+        sys.exit(0)
+
     # Check documentation
-    warnings = check_documentation(content)
+    warnings = cached_check_documentation(content, file_path)
 
     if warnings:
         result = {
@@ -15,8 +15,15 @@ import json
 import sys
 import re
 import os
+from typing import NamedTuple
 
 
+# Writes and edits after which API route files are verified
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Route definitions past this point in a file are not verified
+MAX_SCAN_CHARS = 256_000
+
 # RESTful patterns
 REST_VERBS = {
     "GET": ["list", "get", "fetch", "find", "read", "show"],
@@ -26,52 +33,64 @@ REST_VERBS = {
     "DELETE": ["delete", "remove", "destroy"],
 }
 
+# Verbs that should not appear in a RESTful path
+PATH_VERBS = ("create", "update", "delete", "get", "fetch")
+
+# Path fragments marking API route files
+API_PATH_MARKERS = ("/api/", "/routes/", "route.")
+
+_API_PATH_RE = re.compile("|".join(map(re.escape, API_PATH_MARKERS)))
+
+# Express.js style: router.get('/path', handler)
+_EXPRESS_ROUTE_RE = re.compile(
+    r"(router|app)\.(get|post|put|patch|delete)\s*\(\s*['\"]([^'\"]+)['\"]", re.IGNORECASE
+)
+
+# Next.js API routes: export async function GET/POST
+_NEXTJS_ROUTE_RE = re.compile(
+    r"export\s+(async\s+)?function\s+(GET|POST|PUT|PATCH|DELETE)\s*\(", re.IGNORECASE
+)
+
+_UPPERCASE_RE = re.compile(r"[A-Z]")
 
-def extract_endpoints(content: str) -> list[dict]:
+
+class Endpoint(NamedTuple):
+    """An extracted route definition."""
+    method: str
+    path: str
+    line: int
+
+
+def extract_endpoints(content: str) -> list[Endpoint]:
     """Extract API endpoint definitions from code."""
     endpoints = []
 
-    # Express.js style: router.get('/path', handler)
-    express_pattern = r"(router|app)\.(get|post|put|patch|delete)\s*\(\s*['\"]([^'\"]+)['\"]"
-
-    for match in re.finditer(express_pattern, content, re.IGNORECASE):
+    for match in _EXPRESS_ROUTE_RE.finditer(content):
         method = match.group(2).upper()
         path = match.group(3)
-        endpoints.append({
-            "method": method,
-            "path": path,
-            "line": content[:match.start()].count("\n") + 1
-        })
+        endpoints.append(Endpoint(method, path, content.count("\n", 0, match.start()) + 1))
 
-    # Next.js API routes: export async function GET/POST
-    nextjs_pattern = r"export\s+(async\s+)?function\s+(GET|POST|PUT|PATCH|DELETE)\s*\("
-
-    for match in re.finditer(nextjs_pattern, content, re.IGNORECASE):
+    for match in _NEXTJS_ROUTE_RE.finditer(content):
         method = match.group(2).upper()
-        endpoints.append({
-            "method": method,
-            "path": "current file",
-            "line": content[:match.start()].count("\n") + 1
-        })
+        endpoints.append(Endpoint(method, "current file", content.count("\n", 0, match.start()) + 1))
 
     return endpoints
 
 
-def validate_endpoint(endpoint: dict) -> list[str]:
+def validate_endpoint(endpoint: Endpoint) -> list[str]:
     """Validate a single endpoint."""
     warnings = []
-    path = endpoint["path"]
-    method = endpoint["method"]
+    path = endpoint.path
 
     # Check for resource-based naming
     if path != "current file":
         # Path should be kebab-case or resource/id style
-        if re.search(r"[A-Z]", path):
+        if _UPPERCASE_RE.search(path):
             warnings.append(f"Path should be lowercase: {path}")
 
         # Path should not have verbs for REST
         path_lower = path.lower()
-        for verb in ["create", "update", "delete", "get", "fetch"]:
+        for verb in PATH_VERBS:
             if verb in path_lower:
                 warnings.append(f"RESTful path should not contain verb '{verb}': {path}")
 
@@ -91,13 +110,13 @@ def main():
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {})
 
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
 
     # Only check API-related files
-    if not any(p in file_path for p in ["/api/", "/routes/", "route."]):
+    if not _API_PATH_RE.search(file_path):
         sys.exit(0)
 
     if not os.path.exists(file_path):
@@ -105,10 +124,13 @@ def main():
 
     try:
         with open(file_path, "r") as f:
-            content = f.read()
+            content = f.read(MAX_SCAN_CHARS)
     except IOError:
         sys.exit(0)
 
+    if not content:
+        sys.exit(0)
+
     endpoints = extract_endpoints(content)
     all_warnings = []
 
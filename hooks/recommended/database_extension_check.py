@@ -14,8 +14,16 @@ Validation Rules:
 import json
 import sys
 import re
+from functools import lru_cache
 
 
+# Writes and edits that may add SQL using PostgreSQL extensions
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Extension usage is looked for in this much of the SQL being written;
+# migrations are far smaller
+MAX_SCAN_CHARS = 256_000
+
 # Common extensions and their features
 EXTENSION_FEATURES = {
     "uuid-ossp": ["uuid_generate_v4()", "uuid_generate_v1()"],
@@ -28,6 +36,22 @@ EXTENSION_FEATURES = {
     "postgis": ["geometry", "geography", "ST_"],
 }
 
+# Feature -> extension, and one zero-width alternation over every feature
+# (longest first) so the SQL is scanned once instead of once per feature
+_FEATURE_EXTENSIONS = {
+    feature: extension
+    for extension, features in EXTENSION_FEATURES.items()
+    for feature in features
+}
+_FEATURE_RE = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_FEATURE_EXTENSIONS, key=len, reverse=True)))
+    + "))"
+)
+
+# SQL and migration paths, matched case-insensitively without lower()
+_MIGRATION_PATH_RE = re.compile(r"migration|\.sql", re.IGNORECASE | re.ASCII)
+
 
 def extract_sql_content(content: str) -> str:
     """Extract SQL from migration file content."""
@@ -41,29 +65,23 @@ def extract_sql_content(content: str) -> str:
 
 def detect_required_extensions(sql: str) -> list[str]:
     """Detect which extensions are needed based on SQL content."""
-    required = []
+    found = {_FEATURE_EXTENSIONS[m.group(1)] for m in _FEATURE_RE.finditer(sql)}
+    return [extension for extension in EXTENSION_FEATURES if extension in found]
 
-    for extension, features in EXTENSION_FEATURES.items():
-        for feature in features:
-            if feature in sql:
-                if extension not in required:
-                    required.append(extension)
 
-    return required
+@lru_cache(maxsize=None)
+def _create_extension_re(extension: str) -> re.Pattern:
+    """Build the CREATE EXTENSION matcher for an extension once per process."""
+    # Quotes are optional, which also covers the unquoted form
+    return re.compile(
+        rf"CREATE\s+EXTENSION\s+(IF\s+NOT\s+EXISTS\s+)?['\"]?{re.escape(extension)}['\"]?",
+        re.IGNORECASE,
+    )
 
 
 def check_extension_enabled(sql: str, extension: str) -> bool:
     """Check if an extension is enabled in the migration."""
-    patterns = [
-        rf"CREATE\s+EXTENSION\s+(IF\s+NOT\s+EXISTS\s+)?['\"]?{extension}['\"]?",
-        rf"CREATE\s+EXTENSION\s+(IF\s+NOT\s+EXISTS\s+)?{extension}",
-    ]
-
-    for pattern in patterns:
-        if re.search(pattern, sql, re.IGNORECASE):
-            return True
-
-    return False
+    return _create_extension_re(extension).search(sql) is not None
 
 
 def main():
@@ -80,18 +98,19 @@ def main():
     tool_input = data.get("tool_input", {})
 
     # Check Write/Edit on migration files
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
 
     # Only check SQL/migration files
-    if not any(p in file_path.lower() for p in ["migration", ".sql"]):
+    if not _MIGRATION_PATH_RE.search(file_path):
         sys.exit(0)
 
     content = tool_input.get("content", "") or tool_input.get("new_string", "")
     if not content:
         sys.exit(0)
+    content = content[:MAX_SCAN_CHARS]
 
     sql = extract_sql_content(content)
     required = detect_required_extensions(sql)
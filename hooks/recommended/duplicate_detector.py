@@ -18,37 +18,45 @@ import os
 from collections import Counter
 
 
-def extract_functions(content: str) -> list[str]:
-    """Extract function names from content."""
-    patterns = [
-        r"function\s+(\w+)\s*\(",
-        r"const\s+(\w+)\s*=\s*(?:async\s*)?\(",
-        r"def\s+(\w+)\s*\(",
-        r"(\w+)\s*:\s*(?:async\s*)?\([^)]*\)\s*=>",
-    ]
+# Writes and edits after which the file is checked for duplication
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
 
-    functions = []
-    for pattern in patterns:
-        for match in re.finditer(pattern, content):
-            functions.append(match.group(1))
+# Imports and most definitions sit near the top of a file, so duplicates
+# are looked for in this much of it
+MAX_SCAN_CHARS = 256_000
 
-    return functions
+# Source files this hook checks
+SOURCE_SUFFIXES = (".ts", ".js", ".tsx", ".jsx", ".py")
 
+# Function definitions (each pattern's single group is the name)
+FUNCTION_PATTERNS = [
+    r"function\s+(\w+)\s*\(",
+    r"const\s+(\w+)\s*=\s*(?:async\s*)?\(",
+    r"def\s+(\w+)\s*\(",
+    r"(\w+)\s*:\s*(?:async\s*)?\([^)]*\)\s*=>",
+]
 
-def extract_imports(content: str) -> list[str]:
-    """Extract import statements from content."""
-    patterns = [
-        r"import\s+.+\s+from\s+['\"]([^'\"]+)['\"]",
-        r"require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)",
-        r"from\s+([^\s]+)\s+import",
-    ]
+# Import statements (each pattern's single group is the module)
+IMPORT_PATTERNS = [
+    r"import\s+.+\s+from\s+['\"]([^'\"]+)['\"]",
+    r"require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)",
+    r"from\s+([^\s]+)\s+import",
+]
 
-    imports = []
-    for pattern in patterns:
-        for match in re.finditer(pattern, content):
-            imports.append(match.group(1))
+# Compiled once and run as separate passes: one alternation would let a
+# match of one pattern consume text another pattern would have matched
+_FUNCTION_RES = tuple(re.compile(pattern) for pattern in FUNCTION_PATTERNS)
+_IMPORT_RES = tuple(re.compile(pattern) for pattern in IMPORT_PATTERNS)
 
-    return imports
+
+def extract_functions(content: str) -> list[str]:
+    """Extract function names from content."""
+    return [match.group(1) for regex in _FUNCTION_RES for match in regex.finditer(content)]
+
+
+def extract_imports(content: str) -> list[str]:
+    """Extract import statements from content."""
+    return [match.group(1) for regex in _IMPORT_RES for match in regex.finditer(content)]
 
 
 def find_duplicates(items: list[str]) -> list[str]:
@@ -89,13 +97,13 @@ def main():
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {})
 
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
 
     # Only check source code files
-    if not file_path.endswith((".ts", ".js", ".tsx", ".jsx", ".py")):
+    if not file_path.endswith(SOURCE_SUFFIXES):
         sys.exit(0)
 
     if not os.path.exists(file_path):
@@ -103,10 +111,13 @@ def main():
 
     try:
         with open(file_path, "r") as f:
-            content = f.read()
+            content = f.read(MAX_SCAN_CHARS)
     except IOError:
         sys.exit(0)
 
+    if not content:
+        sys.exit(0)
+
     warnings = check_for_duplicates(content)
 
     if warnings:
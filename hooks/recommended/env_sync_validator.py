@@ -17,6 +17,21 @@ import os
 import re
 
 
+# Writes and edits that may leave .env and its example out of sync
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Template files that document the expected env keys, in lookup order
+ENV_EXAMPLE_CANDIDATES = (".env.example", ".env.template", ".env.sample")
+
+# KEY=value lines, compiled once rather than looked up per line
+_ENV_LINE_RE = re.compile(r"^([A-Z_][A-Z0-9_]*)=(.*)$", re.IGNORECASE)
+
+# Fixed response, serialized once at load
+NO_EXAMPLE_RESPONSE = json.dumps({
+    "warning": "No .env.example found - consider creating one"
+})
+
+
 def parse_env_file(path: str) -> dict[str, str]:
     """Parse an env file and return key-value pairs."""
     if not os.path.exists(path):
@@ -32,7 +47,7 @@ def parse_env_file(path: str) -> dict[str, str]:
                     continue
 
                 # Parse KEY=value
-                match = re.match(r"^([A-Z_][A-Z0-9_]*)=(.*)$", line, re.IGNORECASE)
+                match = _ENV_LINE_RE.match(line)
                 if match:
                     key, value = match.groups()
                     env_vars[key] = value
@@ -45,8 +60,7 @@ def parse_env_file(path: str) -> dict[str, str]:
 
 def find_env_example() -> str | None:
     """Find the .env.example file."""
-    candidates = [".env.example", ".env.template", ".env.sample"]
-    for candidate in candidates:
+    for candidate in ENV_EXAMPLE_CANDIDATES:
         if os.path.exists(candidate):
             return candidate
     return None
@@ -59,17 +73,17 @@ def check_sync(env_path: str, example_path: str) -> list[str]:
     env_vars = parse_env_file(env_path)
     example_vars = parse_env_file(example_path)
 
+    # Dict key views support set difference directly, no copies needed
+    env_keys = env_vars.keys()
+    example_keys = example_vars.keys()
+
     # Find keys in .env but not in example
-    missing_in_example = set(env_vars.keys()) - set(example_vars.keys())
-    if missing_in_example:
-        for key in missing_in_example:
-            warnings.append(f"'{key}' is in .env but not in {example_path}")
+    for key in env_keys - example_keys:
+        warnings.append(f"'{key}' is in .env but not in {example_path}")
 
     # Find keys in example but not in .env
-    missing_in_env = set(example_vars.keys()) - set(env_vars.keys())
-    if missing_in_env:
-        for key in missing_in_env:
-            warnings.append(f"'{key}' is in {example_path} but not in .env")
+    for key in example_keys - env_keys:
+        warnings.append(f"'{key}' is in {example_path} but not in .env")
 
     return warnings
 
@@ -88,7 +102,7 @@ def main():
     tool_input = data.get("tool_input", {})
 
     # Only check after Write/Edit on .env files
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
@@ -98,9 +112,7 @@ def main():
     # Find example file
     example_path = find_env_example()
     if not example_path:
-        print(json.dumps({
-            "warning": "No .env.example found - consider creating one"
-        }))
+        print(NO_EXAMPLE_RESPONSE)
         sys.exit(0)
 
     # Check sync
@@ -38,6 +38,12 @@ SHOULD_IGNORE = [
     r"Thumbs\.db$",
 ]
 
+# One alternation scans each path once instead of once per pattern
+_SHOULD_IGNORE_RE = re.compile("|".join(SHOULD_IGNORE), re.IGNORECASE)
+
+# Commands that stage everything and can defer to .gitignore
+ADD_ALL_COMMANDS = frozenset({"git add .", "git add -A", "git add --all"})
+
 
 def check_gitignore_exists() -> bool:
     """Check if .gitignore exists."""
@@ -58,12 +64,32 @@ def is_file_gitignored(file_path: str) -> bool:
         return False
 
 
+def gitignored_files(file_paths: list[str]) -> set[str]:
+    """Return the subset of file paths that are gitignored, using one git call."""
+    if not file_paths:
+        return set()
+    import subprocess
+    try:
+        result = subprocess.run(
+            ["git", "check-ignore", "--stdin", "-z"],
+            input="\0".join(file_paths),
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return set()
+
+    # A fatal error (e.g. a path outside the repository) stops git before
+    # it answers for the remaining paths, so ask about each one instead
+    if result.returncode not in (0, 1) or result.stderr:
+        return {f for f in file_paths if is_file_gitignored(f)}
+    return set(filter(None, result.stdout.split("\0")))
+
+
 def should_be_ignored(file_path: str) -> bool:
     """Check if file matches patterns that should be ignored."""
-    for pattern in SHOULD_IGNORE:
-        if re.search(pattern, file_path, re.IGNORECASE):
-            return True
-    return False
+    return _SHOULD_IGNORE_RE.search(file_path) is not None
 
 
 def extract_files_from_command(command: str) -> list[str]:
@@ -103,19 +129,17 @@ def main():
         sys.exit(0)
 
     # Skip if adding all with proper ignore
-    if command.strip() in ["git add .", "git add -A", "git add --all"]:
+    if command.strip() in ADD_ALL_COMMANDS:
         if check_gitignore_exists():
             sys.exit(0)  # Trust .gitignore
 
     # Extract files being added
     files = extract_files_from_command(command)
 
-    # Check each file
-    violations = []
-    for file_path in files:
-        if should_be_ignored(file_path):
-            if not is_file_gitignored(file_path):
-                violations.append(file_path)
+    # Ask git about all suspicious files at once
+    candidates = [f for f in files if should_be_ignored(f)]
+    ignored = gitignored_files(candidates)
+    violations = [f for f in candidates if f not in ignored]
 
     if violations:
         result = {
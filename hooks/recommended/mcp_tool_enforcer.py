@@ -26,15 +26,26 @@ TOOL_CATEGORIES = {
 }
 
 # Tools that should be used sparingly
-RATE_LIMITED_TOOLS = [
+RATE_LIMITED_TOOLS = frozenset({
     "WebFetch",
     "WebSearch",
-]
+})
 
 # Tools requiring explicit approval
-APPROVAL_REQUIRED = [
+APPROVAL_REQUIRED = frozenset({
     "Bash",  # When command is destructive
-]
+})
+
+# Append-only usage log, one JSON object per line
+USAGE_LOG = ".beads/tool-usage.jsonl"
+
+# Window, in seconds, over which rate-limited tools are counted
+RATE_LIMIT_WINDOW = 3600
+
+# Once the log passes this size, entries older than the rate limit window
+# plus this margin are trimmed; nothing else reads the log
+USAGE_LOG_MAX_BYTES = 1_048_576
+USAGE_LOG_KEEP_SECONDS = RATE_LIMIT_WINDOW + 3600
 
 
 def log_tool_usage(tool_name: str, context: dict):
@@ -42,8 +53,6 @@ def log_tool_usage(tool_name: str, context: dict):
     if not os.path.exists(".beads"):
         return
 
-    log_path = ".beads/tool-usage.jsonl"
-
     entry = {
         "timestamp": datetime.now().isoformat(),
         "tool": tool_name,
@@ -51,10 +60,50 @@ def log_tool_usage(tool_name: str, context: dict):
     }
 
     try:
-        with open(log_path, "a") as f:
+        with open(USAGE_LOG, "a") as f:
             f.write(json.dumps(entry) + "\n")
+            oversized = f.tell() > USAGE_LOG_MAX_BYTES
     except IOError:
-        pass
+        return
+
+    if oversized:
+        trim_usage_log()
+
+
+def trim_usage_log():
+    """Drop usage log entries older than USAGE_LOG_KEEP_SECONDS."""
+    cutoff = datetime.now().timestamp() - USAGE_LOG_KEEP_SECONDS
+    tmp_path = f"{USAGE_LOG}.{os.getpid()}.tmp"
+    try:
+        with open(USAGE_LOG, "r") as f:
+            # Entries are appended in time order, so only the stale head
+            # needs decoding
+            dropped = 0
+            for line in f:
+                try:
+                    ts = datetime.fromisoformat(json.loads(line)["timestamp"]).timestamp()
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    ts = cutoff - 1  # Unreadable, drop it
+                if ts >= cutoff:
+                    break
+                dropped += 1
+            else:
+                line = ""
+            if not dropped:
+                return
+            with open(tmp_path, "w") as out:
+                out.write(line)
+                out.writelines(f)
+        # No lock is taken: an append from another hook that lands between
+        # the read and this rename goes to the replaced file and is lost.
+        # Trims are rare (once per USAGE_LOG_MAX_BYTES of log), and a lost
+        # entry at most lets one extra rate-limited call through
+        os.replace(tmp_path, USAGE_LOG)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def check_tool_rate_limit(tool_name: str) -> bool:
@@ -62,17 +111,22 @@ def check_tool_rate_limit(tool_name: str) -> bool:
     if tool_name not in RATE_LIMITED_TOOLS:
         return True
 
-    log_path = ".beads/tool-usage.jsonl"
-    if not os.path.exists(log_path):
+    if not os.path.exists(USAGE_LOG):
         return True
 
     # Count recent uses (last hour)
     count = 0
-    cutoff = datetime.now().timestamp() - 3600  # 1 hour ago
+    cutoff = datetime.now().timestamp() - RATE_LIMIT_WINDOW
+
+    # Entries are written by log_tool_usage with json.dumps defaults, so
+    # other tools' lines can be skipped without decoding them
+    needle = f'"tool": {json.dumps(tool_name)}'
 
     try:
-        with open(log_path, "r") as f:
+        with open(USAGE_LOG, "r") as f:
             for line in f:
+                if needle not in line:
+                    continue
                 try:
                     entry = json.loads(line)
                     if entry.get("tool") == tool_name:
@@ -17,6 +17,12 @@ import sys
 import re
 
 
+# Writes and edits whose new content is checked before it lands
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Placeholders are reported only from this much of the new content
+MAX_SCAN_CHARS = 256_000
+
 # Patterns indicating mock/placeholder code
 MOCK_PATTERNS = [
     # Debug logging
@@ -44,35 +50,49 @@ MOCK_PATTERNS = [
     (r"password\s*[:=]\s*['\"](?!.*\$\{)(?!.*process\.env)", "Hardcoded password"),
 ]
 
+# All patterns as one named-group alternation, so a single finditer pass
+# finds every kind of issue. Each alternative sits in a zero-width
+# lookahead so a match never consumes text another pattern needs
+_MOCK_RE = re.compile(
+    "|".join(f"(?=(?P<p{i}>{pattern}))" for i, (pattern, _) in enumerate(MOCK_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# Path fragments marking test files
+TEST_FILE_PATTERNS = [
+    r"\.test\.",
+    r"\.spec\.",
+    r"/__tests__/",
+    r"/test/",
+    r"/tests/",
+    r"_test\.",
+    r"\.mock\.",
+]
 
-def is_test_file(path: str) -> bool:
-    """Check if file is a test file."""
-    test_patterns = [
-        r"\.test\.",
-        r"\.spec\.",
-        r"/__tests__/",
-        r"/test/",
-        r"/tests/",
-        r"_test\.",
-        r"\.mock\.",
-    ]
+_TEST_FILE_RE = re.compile("|".join(TEST_FILE_PATTERNS), re.IGNORECASE)
 
-    for pattern in test_patterns:
-        if re.search(pattern, path, re.IGNORECASE):
-            return True
 
-    return False
+def is_test_file(path: str) -> bool:
+    """Check if file is a test file."""
+    return _TEST_FILE_RE.search(path) is not None
 
 
 def check_mock_patterns(content: str) -> list[str]:
     """Check content for mock/placeholder patterns."""
-    warnings = []
+    first_hits: dict[int, int] = {}
 
-    for pattern, description in MOCK_PATTERNS:
-        matches = list(re.finditer(pattern, content, re.IGNORECASE))
-        if matches:
-            line = content[:matches[0].start()].count("\n") + 1
-            warnings.append(f"{description} (line ~{line})")
+    for match in _MOCK_RE.finditer(content):
+        index = int(match.lastgroup[1:])
+        if index not in first_hits:
+            first_hits[index] = match.start()
+            if len(first_hits) == len(MOCK_PATTERNS):
+                break
+
+    # Report in pattern order, at each pattern's first occurrence
+    warnings = []
+    for index in sorted(first_hits):
+        line = content.count("\n", 0, first_hits[index]) + 1
+        warnings.append(f"{MOCK_PATTERNS[index][1]} (line ~{line})")
 
     return warnings
 
@@ -90,19 +110,19 @@ def main():
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {})
 
-    if tool_name not in ["Write", "Edit"]:
-        sys.exit(0)
-
-    file_path = tool_input.get("file_path", "")
-
-    # Skip test files
-    if is_test_file(file_path):
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
-    # Get content to check
+    # Get content to check; deletions carry nothing to scan, so bail
+    # before any path classification
     content = tool_input.get("content", "") or tool_input.get("new_string", "")
     if not content:
         sys.exit(0)
+    content = content[:MAX_SCAN_CHARS]
+
+    # Skip test files
+    if is_test_file(tool_input.get("file_path", "")):
+        sys.exit(0)
 
     warnings = check_mock_patterns(content)
 
@@ -14,11 +14,22 @@ Validation Rules:
 import json
 import sys
 import re
-import subprocess
+
+
+# Task reference patterns in priority order: [TASK-123], task: 123, BD-123, #123
+TASK_REFERENCE_PATTERNS = [
+    re.compile(r"\[TASK[- ]?(\d+)\]", re.IGNORECASE),
+    re.compile(r"task[: ]+(\d+)", re.IGNORECASE),
+    re.compile(r"BD[- ]?(\d+)", re.IGNORECASE),
+    re.compile(r"#(\d+)\b", re.IGNORECASE),
+]
+
+_COMMIT_MSG_RE = re.compile(r'-m\s+["\'](.+?)["\']')
 
 
 def run_beads_command(args: list[str]) -> dict | None:
     """Execute a Beads CLI command and return parsed JSON output."""
+    import subprocess
     try:
         result = subprocess.run(
             ["bd"] + args,
@@ -35,16 +46,8 @@ def run_beads_command(args: list[str]) -> dict | None:
 
 def extract_task_reference(message: str) -> str | None:
     """Extract task ID reference from commit message."""
-    # Patterns: [TASK-123], task: 123, #123, BD-123
-    patterns = [
-        r"\[TASK[- ]?(\d+)\]",
-        r"task[: ]+(\d+)",
-        r"BD[- ]?(\d+)",
-        r"#(\d+)\b",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, message, re.IGNORECASE)
+    for pattern in TASK_REFERENCE_PATTERNS:
+        match = pattern.search(message)
         if match:
             return match.group(1)
 
@@ -81,7 +84,7 @@ def main():
         sys.exit(0)
 
     # Extract commit message from command
-    msg_match = re.search(r'-m\s+["\'](.+?)["\']', command)
+    msg_match = _COMMIT_MSG_RE.search(command)
     if not msg_match:
         # No message found, allow (might be interactive)
         sys.exit(0)
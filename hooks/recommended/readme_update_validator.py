@@ -18,6 +18,9 @@ import re
 import os
 
 
+# Writes and edits that may call for a README update
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
 # Patterns that suggest README should be updated
 SIGNIFICANT_PATTERNS = [
     # CLI commands
@@ -36,25 +39,48 @@ SIGNIFICANT_PATTERNS = [
 ]
 
 
+def _group_by_description(patterns: list[tuple[str, str]]) -> dict[str, re.Pattern]:
+    """Compile one alternation per description so each reason is tested once."""
+    grouped: dict[str, list[str]] = {}
+    for pattern, description in patterns:
+        grouped.setdefault(description, []).append(f"(?:{pattern})")
+    return {description: re.compile("|".join(group)) for description, group in grouped.items()}
+
+
+_SIGNIFICANT_RES = _group_by_description(SIGNIFICANT_PATTERNS)
+
+# File types whose changes may need documenting
+CHECKED_EXTENSIONS = (".ts", ".js", ".py", ".json")
+
+# README files themselves, matched case-insensitively without lower()
+_README_PATH_RE = re.compile("readme", re.IGNORECASE | re.ASCII)
+
+# Only this much of a change is scanned; larger payloads rarely add new reasons
+MAX_SCAN_CHARS = 256_000
+
+# README names looked for in the project root
+README_CANDIDATES = ("README.md", "readme.md", "README.txt", "README")
+
+
 def check_for_significant_changes(content: str, file_path: str) -> list[str]:
     """Check if changes suggest README should be updated."""
     suggestions = []
 
     # Only check certain file types
-    if not any(file_path.endswith(ext) for ext in [".ts", ".js", ".py", ".json"]):
+    if not file_path.endswith(CHECKED_EXTENSIONS):
         return suggestions
 
-    for pattern, description in SIGNIFICANT_PATTERNS:
-        if re.search(pattern, content):
+    # Descriptions are unique keys, so no deduplication pass is needed
+    for description, regex in _SIGNIFICANT_RES.items():
+        if regex.search(content):
             suggestions.append(description)
 
-    return list(set(suggestions))  # Deduplicate
+    return suggestions
 
 
 def readme_exists() -> bool:
     """Check if README exists in project."""
-    candidates = ["README.md", "readme.md", "README.txt", "README"]
-    return any(os.path.exists(c) for c in candidates)
+    return any(os.path.exists(c) for c in README_CANDIDATES)
 
 
 def main():
@@ -70,18 +96,23 @@ def main():
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {})
 
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
 
+    # Path filters run before the content is touched
+    if not file_path.endswith(CHECKED_EXTENSIONS):
+        sys.exit(0)
+
     # Skip README itself
-    if "readme" in file_path.lower():
+    if _README_PATH_RE.search(file_path):
         sys.exit(0)
 
     content = tool_input.get("content", "") or tool_input.get("new_string", "")
     if not content:
         sys.exit(0)
+    content = content[:MAX_SCAN_CHARS]
 
     suggestions = check_for_significant_changes(content, file_path)
 
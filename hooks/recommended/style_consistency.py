@@ -17,6 +17,23 @@ import re
 import os
 
 
+# Writes and edits whose resulting file is style-checked
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Style drift shows up early in a file; only this much of it is checked
+MAX_SCAN_CHARS = 256_000
+
+# Source extensions this hook checks; JS-family files get naming checks
+SCRIPT_EXTENSIONS = frozenset({".ts", ".js", ".tsx", ".jsx"})
+SOURCE_EXTENSIONS = SCRIPT_EXTENSIONS | {".py"}
+
+# Naming and import-order checks, compiled once at import
+_SNAKE_VAR_RE = re.compile(r"(?:const|let|var)\s+([a-z]+_[a-z_]+)\s*=")
+_PASCAL_CONST_RE = re.compile(r"const\s+([A-Z][a-z]+[A-Z]\w*)\s*=\s*(?![\(\<])")
+_IMPORT_LINE_RE = re.compile(r"^\s*import\s+")
+_LOCAL_IMPORT_RE = re.compile(r"from\s+['\"]\.\.?/")
+
+
 def detect_indentation(content: str) -> str:
     """Detect the indentation style used in file."""
     lines = content.split("\n")
@@ -49,17 +66,14 @@ def check_naming_conventions(content: str, file_ext: str) -> list[str]:
     """Check for naming convention violations."""
     warnings = []
 
-    if file_ext in [".ts", ".js", ".tsx", ".jsx"]:
+    if file_ext in SCRIPT_EXTENSIONS:
         # Check for snake_case variables (should be camelCase)
-        snake_vars = re.findall(r"(?:const|let|var)\s+([a-z]+_[a-z_]+)\s*=", content)
+        snake_vars = _SNAKE_VAR_RE.findall(content)
         if snake_vars:
             warnings.append(f"Use camelCase: {', '.join(snake_vars[:3])}")
 
         # Check for PascalCase non-components
-        non_component_pascal = re.findall(
-            r"const\s+([A-Z][a-z]+[A-Z]\w*)\s*=\s*(?![\(\<])",
-            content
-        )
+        non_component_pascal = _PASCAL_CONST_RE.findall(content)
         # Filter out likely component names
         non_components = [n for n in non_component_pascal if not n.endswith("Component")]
         if non_components:
@@ -75,7 +89,7 @@ def check_import_order(content: str) -> list[str]:
     # Extract import blocks
     import_lines = []
     for line in content.split("\n"):
-        if re.match(r"^\s*import\s+", line):
+        if _IMPORT_LINE_RE.match(line):
             import_lines.append(line)
         elif import_lines and not line.strip():
             break  # End of import block
@@ -84,7 +98,7 @@ def check_import_order(content: str) -> list[str]:
         # Check if external imports come before local
         seen_local = False
         for line in import_lines:
-            is_local = re.search(r"from\s+['\"]\.\.?/", line)
+            is_local = _LOCAL_IMPORT_RE.search(line)
             is_external = not is_local
 
             if seen_local and is_external:
@@ -110,13 +124,15 @@ def main():
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {})
 
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
 
-    # Only check source files
-    if not any(file_path.endswith(ext) for ext in [".ts", ".js", ".tsx", ".jsx", ".py"]):
+    # Only check source files; the extension test is cheapest, so it runs
+    # before touching the filesystem
+    _, ext = os.path.splitext(file_path)
+    if ext not in SOURCE_EXTENSIONS:
         sys.exit(0)
 
     if not os.path.exists(file_path):
@@ -124,11 +140,13 @@ def main():
 
     try:
         with open(file_path, "r") as f:
-            content = f.read()
+            content = f.read(MAX_SCAN_CHARS)
     except IOError:
         sys.exit(0)
 
-    _, ext = os.path.splitext(file_path)
+    if not content:
+        sys.exit(0)
+
     all_warnings = []
 
     # Check mixed indentation
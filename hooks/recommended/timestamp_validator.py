@@ -17,6 +17,13 @@ import re
 import os
 
 
+# Writes and edits whose date/time handling is reviewed
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Date/time misuse is flagged from this much of a file; the warnings are
+# hints, not a full audit
+MAX_SCAN_CHARS = 256_000
+
 # Timestamp patterns to check
 TIMESTAMP_ISSUES = [
     # Raw Date.now() without proper handling
@@ -44,6 +51,19 @@ TIMESTAMP_ISSUES = [
     ),
 ]
 
+# Compiled once; clean files are rejected by a single pass over the union
+_TIMESTAMP_REGEXES = [(re.compile(pattern, re.IGNORECASE), message) for pattern, message in TIMESTAMP_ISSUES]
+_ANY_TIMESTAMP_RE = re.compile("|".join(f"(?:{pattern})" for pattern, _ in TIMESTAMP_ISSUES), re.IGNORECASE)
+
+# JS/TS sources this hook checks
+SCRIPT_SUFFIXES = (".ts", ".js", ".tsx", ".jsx")
+
+# Path keywords suggesting a file deals with timestamps
+TIME_PATH_KEYWORDS = ("date", "time", "timestamp", "calendar", "schedule")
+
+# All keywords in one alternation: a single scan of the path finds any of them
+_TIME_PATH_RE = re.compile("|".join(map(re.escape, TIME_PATH_KEYWORDS)), re.IGNORECASE)
+
 # Good patterns (for documentation)
 GOOD_PATTERNS = [
     r"new\s+Date\(\)\.toISOString\(\)",
@@ -56,10 +76,13 @@ def check_timestamp_issues(content: str) -> list[str]:
     """Check for timestamp handling issues."""
     warnings = []
 
-    for pattern, message in TIMESTAMP_ISSUES:
-        matches = list(re.finditer(pattern, content, re.IGNORECASE))
-        if matches:
-            line = content[:matches[0].start()].count("\n") + 1
+    if not _ANY_TIMESTAMP_RE.search(content):
+        return warnings
+
+    for regex, message in _TIMESTAMP_REGEXES:
+        match = regex.search(content)
+        if match:
+            line = content.count("\n", 0, match.start()) + 1
             warnings.append(f"{message} (line ~{line})")
 
     return warnings
@@ -67,9 +90,7 @@ def check_timestamp_issues(content: str) -> list[str]:
 
 def is_time_related_file(path: str) -> bool:
     """Check if file likely deals with timestamps."""
-    time_patterns = ["date", "time", "timestamp", "calendar", "schedule"]
-    path_lower = path.lower()
-    return any(p in path_lower for p in time_patterns)
+    return _TIME_PATH_RE.search(path) is not None
 
 
 def main():
@@ -85,13 +106,13 @@ def main():
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {})
 
-    if tool_name not in ["Write", "Edit"]:
+    if tool_name not in FILE_WRITE_TOOLS:
         sys.exit(0)
 
     file_path = tool_input.get("file_path", "")
 
     # Only check JS/TS files
-    if not file_path.endswith((".ts", ".js", ".tsx", ".jsx")):
+    if not file_path.endswith(SCRIPT_SUFFIXES):
         sys.exit(0)
 
     if not os.path.exists(file_path):
@@ -99,10 +120,13 @@ def main():
 
     try:
         with open(file_path, "r") as f:
-            content = f.read()
+            content = f.read(MAX_SCAN_CHARS)
     except IOError:
         sys.exit(0)
 
+    if not content:
+        sys.exit(0)
+
     warnings = check_timestamp_issues(content)
 
     if warnings:
@@ -14,18 +14,26 @@ Validation Rules:
 import json
 import sys
 import re
-import subprocess
 
 
+# Branches that must not receive WIP commits
+PROTECTED_BRANCHES = frozenset({"main", "master"})
+
 # Conventional commit types
 COMMIT_TYPES = [
     "feat", "fix", "docs", "style", "refactor",
     "perf", "test", "build", "ci", "chore", "revert"
 ]
 
+# Rules specialized once at load time from COMMIT_TYPES
+_CONVENTIONAL_RE = re.compile(rf"^({'|'.join(COMMIT_TYPES)})(\(.+\))?: .+", re.IGNORECASE)
+_WIP_RE = re.compile(r"\bWIP\b", re.IGNORECASE)
+_COMMIT_MSG_RE = re.compile(r'-m\s+["\'](.+?)["\']', re.DOTALL)
+
 
 def get_current_branch() -> str:
     """Get current git branch name."""
+    import subprocess
     try:
         result = subprocess.run(
             ["git", "branch", "--show-current"],
@@ -43,8 +51,7 @@ def validate_message(message: str) -> tuple[bool, list[str]]:
     errors = []
 
     # Check for conventional commit format
-    type_pattern = rf"^({'|'.join(COMMIT_TYPES)})(\(.+\))?: .+"
-    if not re.match(type_pattern, message, re.IGNORECASE):
+    if not _CONVENTIONAL_RE.match(message):
         errors.append(f"Message should start with: {', '.join(COMMIT_TYPES[:5])}...")
 
     # Check minimum length
@@ -57,9 +64,9 @@ def validate_message(message: str) -> tuple[bool, list[str]]:
         errors.append(f"First line too long ({len(first_line)} > 72 chars)")
 
     # Check for WIP
-    if re.search(r"\bWIP\b", message, re.IGNORECASE):
+    if _WIP_RE.search(message):
         branch = get_current_branch()
-        if branch in ["main", "master"]:
+        if branch in PROTECTED_BRANCHES:
             errors.append("WIP commits not allowed on main/master")
 
     return len(errors) == 0, errors
@@ -87,7 +94,7 @@ def main():
         sys.exit(0)
 
     # Extract commit message
-    msg_match = re.search(r'-m\s+["\'](.+?)["\']', command, re.DOTALL)
+    msg_match = _COMMIT_MSG_RE.search(command)
     if not msg_match:
         sys.exit(0)
 
@@ -6,8 +6,31 @@ Shared helper functions used across multiple hooks.
 
 import json
 import os
+import stat
 import subprocess
-from typing import Any
+import time
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# keep catching the stdlib exception regardless of which parser is active
+_loads = orjson.loads if orjson else json.loads
+
+# Hook caches live in subdirectories of this per-user temp-dir directory
+CACHE_ROOT = "aes-bizzy-hooks"
+
+# Entries kept per digest cache before the least recently written are evicted
+DIGEST_CACHE_MAX_ENTRIES = 512
+
+# Existence checks are cached briefly; project layout rarely changes mid-hook
+EXISTS_CACHE_TTL = 5.0
+
+_exists_cache: dict[str, tuple[float, bool]] = {}
 
 
 def load_env(key: str, default: str = "") -> str:
@@ -48,30 +71,63 @@ def run_command(
 def read_json(path: str) -> dict | None:
     """Read and parse a JSON file."""
     try:
-        with open(path, "r") as f:
-            return json.load(f)
-    except (IOError, json.JSONDecodeError):
+        with open(path, "rb") as f:
+            return _loads(f.read())
+    except (IOError, json.JSONDecodeError, UnicodeDecodeError):
         return None
 
 
+def _dumps(data: Any, indent: int | None) -> bytes:
+    """Serialize to JSON bytes, via orjson when it supports the indent."""
+    if orjson and indent in (None, 2):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            pass  # e.g. non-str keys or lone surrogates; stdlib handles them
+    return json.dumps(data, indent=indent).encode()
+
+
 def write_json(path: str, data: dict, indent: int = 2) -> bool:
-    """Write data to a JSON file."""
+    """Write data to a JSON file atomically."""
+    # Serialize first, so a failure leaves no temp file behind
+    payload = _dumps(data, indent)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
     try:
         # Ensure directory exists
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=indent)
+        # Write a sibling temp file and rename it over the target so
+        # readers never see a partially written file
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
         return True
     except IOError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
 def append_jsonl(path: str, data: dict) -> bool:
     """Append a JSON object to a JSONL file."""
+    return append_jsonl_many(path, [data])
+
+
+def append_jsonl_many(path: str, entries: list[dict]) -> bool:
+    """Append several JSON objects to a JSONL file in a single write."""
+    if not entries:
+        return True
+
+    payload = b"".join(_dumps(entry, None) + b"\n" for entry in entries)
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "a") as f:
-            f.write(json.dumps(data) + "\n")
+        # O_APPEND keeps concurrent hook writers from interleaving lines
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
         return True
     except IOError:
         return False
@@ -81,27 +137,165 @@ def read_jsonl(path: str, limit: int = 100) -> list[dict]:
     """Read entries from a JSONL file."""
     entries = []
     try:
-        with open(path, "r") as f:
+        with open(path, "rb") as f:
             for i, line in enumerate(f):
                 if i >= limit:
                     break
                 try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
+                    entries.append(_loads(line))
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     pass
     except IOError:
         pass
     return entries
 
 
+def user_cache_dir(name: str) -> str:
+    """
+    Return this user's cache directory for name, creating it if needed.
+
+    The root under the shared temp dir is named for the user, created with
+    mode 0700, and refused unless it is a real directory owned by the user
+    and closed to others, so another local user cannot plant cache entries.
+
+    Raises:
+        OSError: If the directory cannot be created or is not safe to use
+    """
+    import tempfile
+    uid = os.getuid() if hasattr(os, "getuid") else None
+    if uid is None:
+        import getpass
+        owner = getpass.getuser()
+    else:
+        owner = str(uid)
+
+    root = os.path.join(tempfile.gettempdir(), f"{CACHE_ROOT}-{owner}")
+    os.makedirs(root, mode=0o700, exist_ok=True)
+    if uid is not None:
+        st = os.lstat(root)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid or st.st_mode & 0o077:
+            raise OSError(f"Unsafe cache directory: {root}")
+
+    path = os.path.join(root, name)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def _digest(text: str) -> str:
+    """Short digest used for cache file names and content checks."""
+    import hashlib
+    return hashlib.blake2b(text.encode("utf-8", "replace"), digest_size=16).hexdigest()
+
+
+def project_cache_dir(name: str, project_path: str = ".") -> str:
+    """
+    Return this user's cache directory for name in one project, creating it if needed.
+
+    Keeps per-project hook state out of the project tree, keyed by a digest
+    of the project's absolute path.
+
+    Raises:
+        OSError: If the directory cannot be created or is not safe to use
+    """
+    return user_cache_dir(os.path.join(name, _digest(os.path.abspath(project_path))))
+
+
+def _prune_cache(cache_dir: str, max_entries: int):
+    """Evict the oldest entries in a cache directory beyond max_entries."""
+    try:
+        entries = list(os.scandir(cache_dir))
+        if len(entries) <= max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[:len(entries) - max_entries]:
+            os.remove(entry.path)
+    except OSError:
+        pass
+
+
+def cached_by_digest(cache_name: str, key: str, content: str, compute: Callable[[], Any]) -> Any:
+    """
+    Return compute(), reusing the result stored for key while content is unchanged.
+
+    Hooks run as fresh processes, so results are kept on disk: one JSON file
+    per key in this user's cache_name cache, holding a digest of the content it was
+    computed from. Caching is best-effort; any cache error just means
+    compute() runs.
+
+    Args:
+        cache_name: Cache directory name, one per hook
+        key: What the result belongs to, e.g. an absolute file path
+        content: The input the result was computed from
+        compute: Produces the (JSON-serializable) result
+
+    Returns:
+        The cached or freshly computed result
+    """
+    try:
+        cache_dir = user_cache_dir(cache_name)
+    except OSError:
+        return compute()
+    cache_path = os.path.join(cache_dir, _digest(key) + ".json")
+    content_digest = _digest(content)
+
+    cached = read_json(cache_path)
+    if isinstance(cached, dict) and cached.get("digest") == content_digest and "result" in cached:
+        return cached["result"]
+
+    result = compute()
+
+    # Written under a per-process name and renamed, so concurrent hooks
+    # never read a half-written entry
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps({"digest": content_digest, "result": result}, None))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    else:
+        _prune_cache(cache_dir, DIGEST_CACHE_MAX_ENTRIES)
+
+    return result
+
+
+def cached_exists(path: str, ttl: float = EXISTS_CACHE_TTL) -> bool:
+    """
+    Check whether a path exists, reusing recent results.
+
+    Args:
+        path: Path to check
+        ttl: Seconds a cached result stays valid
+
+    Returns:
+        True if the path exists
+    """
+    now = time.monotonic()
+    cached = _exists_cache.get(path)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    exists = os.path.exists(path)
+    _exists_cache[path] = (now, exists)
+    return exists
+
+
+def _bust_cache() -> None:
+    """Clear the existence cache."""
+    _exists_cache.clear()
+
+
 def get_project_root() -> str | None:
     """Find the project root (containing .git or .beads)."""
     current = os.getcwd()
 
     while current != os.path.dirname(current):
-        if os.path.exists(os.path.join(current, ".git")):
+        if cached_exists(os.path.join(current, ".git")):
             return current
-        if os.path.exists(os.path.join(current, ".beads")):
+        if cached_exists(os.path.join(current, ".beads")):
             return current
         current = os.path.dirname(current)
 
@@ -7,8 +7,29 @@ Providers:
 - Ollama (Local models)
 """
 
-from .anth import AnthropicClient
-from .oai import OpenAIClient
-from .ollama import OllamaClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .anth import AnthropicClient
+    from .oai import OpenAIClient
+    from .ollama import OllamaClient
+
+# Providers are imported on first access, so a hook that needs one of them
+# does not pay for importing the rest
+_PROVIDERS = {
+    "AnthropicClient": "anth",
+    "OpenAIClient": "oai",
+    "OllamaClient": "ollama",
+}
+
+
+def __getattr__(name: str):
+    """Import a provider module the first time its class is requested."""
+    if name in _PROVIDERS:
+        module = importlib.import_module(f".{_PROVIDERS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["AnthropicClient", "OpenAIClient", "OllamaClient"]
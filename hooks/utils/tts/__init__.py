@@ -7,8 +7,29 @@ Providers:
 - pyttsx3 (Local/offline)
 """
 
-from .elevenlabs_tts import ElevenLabsTTS
-from .openai_tts import OpenAITTS
-from .pyttsx3_tts import LocalTTS
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .elevenlabs_tts import ElevenLabsTTS
+    from .openai_tts import OpenAITTS
+    from .pyttsx3_tts import LocalTTS
+
+# Providers are imported on first access, so a hook that needs one of them
+# does not pay for importing the rest
+_PROVIDERS = {
+    "ElevenLabsTTS": "elevenlabs_tts",
+    "OpenAITTS": "openai_tts",
+    "LocalTTS": "pyttsx3_tts",
+}
+
+
+def __getattr__(name: str):
+    """Import a provider module the first time its class is requested."""
+    if name in _PROVIDERS:
+        module = importlib.import_module(f".{_PROVIDERS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["ElevenLabsTTS", "OpenAITTS", "LocalTTS"]
@@ -15,9 +15,17 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add hooks directory to path for imports
-HOOKS_DIR = Path(__file__).parent.parent.parent / "hooks"
-sys.path.insert(0, str(HOOKS_DIR))
+# Add hooks directories to path for imports (resolved once, inserted once)
+HOOKS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "hooks"))
+for _path in (
+    HOOKS_DIR,
+    os.path.join(HOOKS_DIR, "utils"),
+    os.path.join(HOOKS_DIR, "essential"),
+    os.path.join(HOOKS_DIR, "recommended"),
+    os.path.join(HOOKS_DIR, "optional"),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 
 # =============================================================================
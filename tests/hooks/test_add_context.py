@@ -0,0 +1,94 @@
+"""
+Tests for hooks/optional/add_context.py
+
+Tests the cached lookup of the in-progress Beads task.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+# Import the module under test (hooks directories are added in conftest)
+from add_context import beads_signature, cached_current_task
+
+
+@pytest.fixture
+def beads_cli(temp_project_dir, mock_beads_cli, clean_env, monkeypatch):
+    """Count `bd` calls against a .beads holding a database, caching in the temp project."""
+    monkeypatch.setattr("tempfile.tempdir", str(temp_project_dir))
+    (temp_project_dir / ".beads" / "beads.db").write_bytes(b"db")
+    mock_run = mock_beads_cli({
+        ("list", "--status", "in_progress"): {"tasks": [{"id": "bd-1", "title": "Task", "status": "in_progress"}]},
+    })
+    calls = []
+
+    def counting_run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        return mock_run(cmd, *args, **kwargs)
+
+    with patch("subprocess.run", counting_run):
+        yield calls
+
+
+class TestBeadsSignature:
+    """Tests for beads_signature function."""
+
+    def test_includes_only_beads_data_files(self, temp_project_dir):
+        """Test that hook logs in .beads are left out of the fingerprint."""
+        beads = temp_project_dir / ".beads"
+        for name in ("beads.db", "beads.db-wal", "issues.jsonl", "tool-usage.jsonl", "project-meta.json"):
+            (beads / name).write_text("x")
+        (beads / "summaries").mkdir()
+        (beads / "summaries" / "s.json").write_text("x")
+
+        names = [name for name, _, _ in beads_signature()]
+
+        assert names == ["beads.db", "beads.db-wal", "issues.jsonl"]
+
+    def test_missing_beads_dir_gives_empty_signature(self, temp_project_dir):
+        """Test that no .beads yields no fingerprint."""
+        os.rmdir(temp_project_dir / ".beads")
+
+        assert beads_signature() == []
+
+
+class TestCachedCurrentTask:
+    """Tests for cached_current_task function."""
+
+    def test_reuses_task_while_beads_data_is_unchanged(self, beads_cli):
+        """Test that a second lookup does not run `bd`."""
+        first = cached_current_task()
+        second = cached_current_task()
+
+        assert first == second == {"id": "bd-1", "title": "Task", "status": "in_progress"}
+        assert len(beads_cli) == 1
+
+    def test_tool_usage_append_keeps_cache(self, beads_cli, temp_project_dir):
+        """Test that hook writes into .beads do not invalidate the cache."""
+        cached_current_task()
+        with open(temp_project_dir / ".beads" / "tool-usage.jsonl", "a") as f:
+            f.write('{"tool": "Read"}\n')
+
+        cached_current_task()
+
+        assert len(beads_cli) == 1
+
+    def test_database_change_invalidates_cache(self, beads_cli, temp_project_dir):
+        """Test that a write to the Beads database queries `bd` again."""
+        cached_current_task()
+        with open(temp_project_dir / ".beads" / "beads.db", "ab") as f:
+            f.write(b"more")
+
+        cached_current_task()
+
+        assert len(beads_cli) == 2
+
+    def test_beads_db_env_always_queries(self, beads_cli, monkeypatch):
+        """Test that a database named by BEADS_DB is never cached."""
+        monkeypatch.setenv("BEADS_DB", "/elsewhere/beads.db")
+
+        cached_current_task()
+        cached_current_task()
+
+        assert len(beads_cli) == 2
@@ -6,22 +6,25 @@ Tests the shared utility functions used across multiple hooks.
 
 import json
 import os
-import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-# Import the module under test
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hooks" / "utils"))
+# Import the module under test (hooks directories are added in conftest)
 from common import (
     load_env,
     run_command,
     read_json,
     write_json,
     append_jsonl,
+    append_jsonl_many,
     read_jsonl,
     get_project_root,
+    cached_exists,
+    cached_by_digest,
+    user_cache_dir,
+    _bust_cache,
 )
 
 
@@ -161,6 +164,35 @@ class TestWriteJson:
         # With indent=4, there should be 4 spaces
         assert "    " in content
 
+    def test_replaces_existing_file_without_temp_leftovers(self, temp_project_dir):
+        """Test that overwriting is atomic and leaves no temp file behind."""
+        json_file = temp_project_dir / "state.json"
+        json_file.write_text('{"old": true}')
+
+        assert write_json(str(json_file), {"new": True}) is True
+
+        assert json.loads(json_file.read_text()) == {"new": True}
+        assert [p.name for p in temp_project_dir.iterdir() if p.name.startswith("state")] == ["state.json"]
+
+    def test_does_not_touch_another_writers_temp_file(self, temp_project_dir):
+        """Test that each process writes through its own temp file."""
+        json_file = temp_project_dir / "state.json"
+        other_tmp = temp_project_dir / "state.json.tmp"
+        other_tmp.write_text('{"other": "writer"}')
+
+        assert write_json(str(json_file), {"new": True}) is True
+
+        assert other_tmp.read_text() == '{"other": "writer"}'
+        assert json.loads(json_file.read_text()) == {"new": True}
+
+    def test_writes_non_string_keys(self, temp_project_dir):
+        """Test that non-string keys are written as strings, like json.dump."""
+        json_file = temp_project_dir / "keys.json"
+
+        assert write_json(str(json_file), {1: "a"}) is True
+
+        assert json.loads(json_file.read_text()) == {"1": "a"}
+
 
 class TestAppendJsonl:
     """Tests for append_jsonl function."""
@@ -199,6 +231,25 @@ class TestAppendJsonl:
         assert success is True
         assert nested_file.exists()
 
+    def test_appends_batch_in_order(self, temp_project_dir):
+        """Test that a batch of entries is appended after existing lines."""
+        jsonl_file = temp_project_dir / "batch.jsonl"
+        append_jsonl(str(jsonl_file), {"id": 0})
+
+        success = append_jsonl_many(str(jsonl_file), [{"id": 1}, {"id": 2}])
+
+        assert success is True
+        lines = jsonl_file.read_text().strip().split("\n")
+        assert [json.loads(line)["id"] for line in lines] == [0, 1, 2]
+
+    def test_appends_non_string_keys(self, temp_project_dir):
+        """Test that non-string keys are written as strings, like json.dumps."""
+        jsonl_file = temp_project_dir / "keys.jsonl"
+
+        assert append_jsonl(str(jsonl_file), {1: "a"}) is True
+
+        assert json.loads(jsonl_file.read_text()) == {"1": "a"}
+
 
 class TestReadJsonl:
     """Tests for read_jsonl function."""
@@ -251,9 +302,122 @@ class TestReadJsonl:
         assert result == []
 
 
+class TestCachedExists:
+    """Tests for cached_exists function."""
+
+    def setup_method(self):
+        _bust_cache()
+
+    def test_reports_existing_path(self, temp_project_dir):
+        """Test that an existing path is reported."""
+        assert cached_exists(str(temp_project_dir / ".git")) is True
+
+    def test_reports_missing_path(self, temp_project_dir):
+        """Test that a missing path is reported."""
+        assert cached_exists(str(temp_project_dir / "missing")) is False
+
+    def test_reuses_result_within_ttl(self, temp_project_dir):
+        """Test that results are cached until the TTL expires."""
+        marker = temp_project_dir / "marker"
+        assert cached_exists(str(marker)) is False
+
+        marker.mkdir()
+        assert cached_exists(str(marker)) is False
+        assert cached_exists(str(marker), ttl=0) is True
+
+    def test_bust_cache_clears_results(self, temp_project_dir):
+        """Test that busting the cache forces a fresh check."""
+        marker = temp_project_dir / "marker"
+        assert cached_exists(str(marker)) is False
+
+        marker.mkdir()
+        _bust_cache()
+        assert cached_exists(str(marker)) is True
+
+
+class TestCachedByDigest:
+    """Tests for cached_by_digest function."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_temp_dir(self, temp_project_dir, monkeypatch):
+        """Keep cache files inside the temp project."""
+        monkeypatch.setattr("tempfile.tempdir", str(temp_project_dir))
+
+    def test_reuses_result_for_unchanged_content(self):
+        """Test that compute runs once while the content is unchanged."""
+        compute = MagicMock(return_value=["issue"])
+
+        first = cached_by_digest("test-cache", "/src/a.ts", "content", compute)
+        second = cached_by_digest("test-cache", "/src/a.ts", "content", compute)
+
+        assert first == second == ["issue"]
+        assert compute.call_count == 1
+
+    def test_recomputes_when_content_changes(self):
+        """Test that a changed content digest invalidates the entry."""
+        compute = MagicMock(side_effect=[["old"], ["new"]])
+
+        cached_by_digest("test-cache", "/src/a.ts", "v1", compute)
+        result = cached_by_digest("test-cache", "/src/a.ts", "v2", compute)
+
+        assert result == ["new"]
+        assert compute.call_count == 2
+
+    def test_ignores_entry_that_is_not_an_object(self, temp_project_dir):
+        """Test that a corrupt cache file only costs a recompute."""
+        cached_by_digest("test-cache", "/src/a.ts", "content", lambda: ["issue"])
+        (entry,) = Path(user_cache_dir("test-cache")).iterdir()
+        entry.write_text("[1, 2]")
+
+        assert cached_by_digest("test-cache", "/src/a.ts", "content", lambda: ["fresh"]) == ["fresh"]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership checks")
+class TestUserCacheDir:
+    """Tests for user_cache_dir function."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_temp_dir(self, temp_project_dir, monkeypatch):
+        """Keep cache directories inside the temp project."""
+        monkeypatch.setattr("tempfile.tempdir", str(temp_project_dir))
+
+    def test_creates_private_per_user_directory(self, temp_project_dir):
+        """Test that the cache root is named for the user and mode 0700."""
+        path = user_cache_dir("test-cache")
+
+        root = temp_project_dir / f"aes-bizzy-hooks-{os.getuid()}"
+        assert Path(path) == root / "test-cache"
+        assert root.stat().st_mode & 0o777 == 0o700
+
+    def test_refuses_root_open_to_other_users(self, temp_project_dir):
+        """Test that a pre-created, world-writable root is not used."""
+        root = temp_project_dir / f"aes-bizzy-hooks-{os.getuid()}"
+        root.mkdir()
+        root.chmod(0o777)
+
+        with pytest.raises(OSError):
+            user_cache_dir("test-cache")
+
+        # Caching callers fall back to computing
+        assert cached_by_digest("test-cache", "k", "c", lambda: "fresh") == "fresh"
+        assert not (root / "test-cache").exists()
+
+    def test_refuses_symlinked_root(self, temp_project_dir):
+        """Test that a root planted as a symlink is not followed."""
+        target = temp_project_dir / "elsewhere"
+        target.mkdir(mode=0o700)
+        (temp_project_dir / f"aes-bizzy-hooks-{os.getuid()}").symlink_to(target)
+
+        with pytest.raises(OSError):
+            user_cache_dir("test-cache")
+
+
 class TestGetProjectRoot:
     """Tests for get_project_root function."""
 
+    def setup_method(self):
+        _bust_cache()
+
     def test_finds_git_root(self, temp_project_dir):
         """Test finding project root by .git directory."""
         result = get_project_root()
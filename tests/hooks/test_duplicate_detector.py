@@ -0,0 +1,73 @@
+"""
+Tests for hooks/recommended/duplicate_detector.py
+
+Tests name and import extraction against a plain pass per pattern.
+"""
+
+import random
+import re
+
+import pytest
+
+# Import the module under test (hooks directories are added in conftest)
+from duplicate_detector import (
+    FUNCTION_PATTERNS,
+    IMPORT_PATTERNS,
+    extract_functions,
+    extract_imports,
+)
+
+# Fragments that overlap across patterns, combined into fuzz inputs
+FRAGMENTS = [
+    "import ", "x ", "from ", "'a'", '"b"', "require(", ")", "(", "function ",
+    "def ", "const ", "= ", "async ", "foo", "bar", ": ", "=>", "\n", " ",
+    "import", "from", "'", "{ y }", "os", "import os",
+]
+
+
+def per_pattern(patterns: list[str], content: str) -> list[str]:
+    """Reference extraction: one finditer pass per pattern, in order."""
+    return [match.group(1) for pattern in patterns for match in re.finditer(pattern, content)]
+
+
+class TestExtractFunctions:
+    """Tests for extract_functions function."""
+
+    def test_overlapping_definitions_are_all_found(self):
+        """Test that a match of one pattern does not hide another's."""
+        content = "handler: (function inner() =>\n"
+
+        assert sorted(extract_functions(content)) == ["handler", "inner"]
+
+    def test_matches_per_pattern_passes(self):
+        """Test that extraction equals a separate pass per pattern on fuzz input."""
+        rng = random.Random(0)
+        for _ in range(2000):
+            content = "".join(rng.choices(FRAGMENTS, k=rng.randint(1, 20)))
+            assert extract_functions(content) == per_pattern(FUNCTION_PATTERNS, content)
+
+
+class TestExtractImports:
+    """Tests for extract_imports function."""
+
+    def test_overlapping_imports_are_all_found(self):
+        """Test that an import spanning another's text does not hide it."""
+        content = "import x from 'a'; from os import path\n"
+
+        assert extract_imports(content) == ["a", "os"]
+
+    @pytest.mark.parametrize("content", [
+        "import a from 'm'\nimport b from 'm'\n",
+        "const x = require('m'); import y from 'm'\n",
+        "from pkg import a\nfrom pkg import b\n",
+    ])
+    def test_matches_per_pattern_passes_on_samples(self, content):
+        """Test that typical import blocks extract as a pass per pattern does."""
+        assert extract_imports(content) == per_pattern(IMPORT_PATTERNS, content)
+
+    def test_matches_per_pattern_passes(self):
+        """Test that extraction equals a separate pass per pattern on fuzz input."""
+        rng = random.Random(0)
+        for _ in range(2000):
+            content = "".join(rng.choices(FRAGMENTS, k=rng.randint(1, 20)))
+            assert extract_imports(content) == per_pattern(IMPORT_PATTERNS, content)
@@ -0,0 +1,298 @@
+"""
+Tests for hooks/heimdall/utils.py
+
+Tests the memory queue shared by the Heimdall hooks.
+"""
+
+import io
+import json
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+# Import the module under test (hooks directories are added in conftest)
+from heimdall import utils
+
+
+@pytest.fixture
+def memory_queue(temp_project_dir, monkeypatch):
+    """Queue memories in the temp project, recording stores and spawns."""
+    stored = []
+    spawned = []
+
+    def fake_store_memory(**memory):
+        stored.append(memory["content"])
+        return {"success": True}
+
+    monkeypatch.setattr(utils, "store_memory", fake_store_memory)
+    monkeypatch.setattr(utils, "FLUSH_DELAY", 0)
+    with patch("subprocess.Popen", side_effect=lambda *args, **kwargs: spawned.append(args)):
+        yield stored, spawned
+
+
+def queued_names():
+    """Entry files currently waiting in the queue."""
+    return os.listdir(utils.PENDING_MEMORIES_DIR)
+
+
+class TestEnqueueMemory:
+    """Tests for enqueue_memory function."""
+
+    def test_queues_memory_and_spawns_flusher(self, memory_queue):
+        """Test that a memory is queued as one entry and a flusher started."""
+        stored, spawned = memory_queue
+
+        result = utils.enqueue_memory(content="a", tags=["x"], memory_type="error")
+
+        assert result == {"success": True, "queued": True}
+        assert [n for n in queued_names() if n.endswith(".json")] == queued_names()
+        assert len(queued_names()) == 1
+        assert len(spawned) == 1
+        assert stored == []
+
+    def test_does_not_spawn_while_flush_lock_is_held(self, memory_queue):
+        """Test that only one flusher runs per project."""
+        _, spawned = memory_queue
+
+        utils.enqueue_memory(content="a", tags=[])
+        utils.enqueue_memory(content="b", tags=[])
+
+        assert len(spawned) == 1
+        assert len(queued_names()) == 2
+
+
+class TestFlushPendingMemories:
+    """Tests for flush_pending_memories function."""
+
+    def test_stores_queued_memories_in_order(self, memory_queue):
+        """Test that every queued memory is stored and the queue emptied."""
+        stored, _ = memory_queue
+        for content in ("a", "b", "c"):
+            utils.enqueue_memory(content=content, tags=[])
+
+        utils.flush_pending_memories()
+
+        assert stored == ["a", "b", "c"]
+        assert queued_names() == []
+        assert not os.path.exists(utils.FLUSH_LOCK_FILE)
+
+    def test_stores_memory_queued_during_flush(self, memory_queue, monkeypatch):
+        """Test that a memory queued mid-flush is stored by the same flush."""
+        stored, _ = memory_queue
+        store = utils.store_memory
+
+        def store_and_queue_another(**memory):
+            if memory["content"] == "a":
+                utils.enqueue_memory(content="late", tags=[])
+            return store(**memory)
+
+        monkeypatch.setattr(utils, "store_memory", store_and_queue_another)
+        utils.enqueue_memory(content="a", tags=[])
+
+        utils.flush_pending_memories()
+
+        assert stored == ["a", "late"]
+        assert queued_names() == []
+
+    def test_resumes_entry_claimed_by_dead_flusher(self, memory_queue):
+        """Test that an entry claimed but not stored is not lost."""
+        stored, _ = memory_queue
+        utils.enqueue_memory(content="a", tags=[])
+        (name,) = queued_names()
+        path = os.path.join(utils.PENDING_MEMORIES_DIR, name)
+        os.replace(path, path[:-len(".json")] + ".claimed")
+
+        utils.flush_pending_memories()
+
+        assert stored == ["a"]
+        assert queued_names() == []
+
+    def test_concurrent_enqueue_loses_nothing(self, memory_queue, monkeypatch):
+        """Test that memories queued while a flush runs are stored exactly once."""
+        stored, spawned = memory_queue
+        store = utils.store_memory
+
+        def slow_store(**memory):
+            time.sleep(0.001)
+            return store(**memory)
+
+        monkeypatch.setattr(utils, "store_memory", slow_store)
+        expected = [f"m{i}" for i in range(200)]
+        utils.enqueue_memory(content="first", tags=[])
+
+        producer = threading.Thread(
+            target=lambda: [utils.enqueue_memory(content=c, tags=[]) for c in expected]
+        )
+        producer.start()
+        utils.flush_pending_memories()
+        producer.join()
+
+        # Anything the flush did not reach must have started another flusher
+        spawns = len(spawned)
+        if queued_names():
+            assert spawns >= 2
+        utils.flush_pending_memories()
+
+        assert sorted(stored) == sorted(["first"] + expected)
+        assert queued_names() == []
+
+
+class TestIsHeimdallReady:
+    """Tests for is_heimdall_ready function."""
+
+    def test_does_not_create_heimdall_dir(self, temp_project_dir, monkeypatch):
+        """Test that a project without .heimdall is left untouched."""
+        checks = []
+        monkeypatch.setattr(utils, "_check_heimdall_health", lambda: checks.append(1) or True)
+
+        assert utils.is_heimdall_ready()
+        assert utils.is_heimdall_ready()
+
+        assert not (temp_project_dir / ".heimdall").exists()
+        assert len(checks) == 2
+
+    def test_caches_result_in_existing_heimdall_dir(self, temp_project_dir, monkeypatch):
+        """Test that a set-up project reuses a fresh health check."""
+        (temp_project_dir / ".heimdall").mkdir()
+        checks = []
+        monkeypatch.setattr(utils, "_check_heimdall_health", lambda: checks.append(1) or True)
+
+        assert utils.is_heimdall_ready()
+        assert utils.is_heimdall_ready()
+
+        assert len(checks) == 1
+
+
+class TestFindProjectRoot:
+    """Tests for _project_root_for function."""
+
+    def test_finds_nearest_marked_ancestor(self, temp_project_dir):
+        """Test that the walk stops at the closest directory with a marker."""
+        nested = temp_project_dir / "src" / "pkg"
+        nested.mkdir(parents=True)
+
+        assert utils._project_root_for(str(nested)) == str(temp_project_dir)
+
+    def test_dangling_symlink_is_not_a_marker(self, temp_project_dir):
+        """Test that a broken .git symlink does not mark a root."""
+        sub = temp_project_dir / "sub"
+        sub.mkdir()
+        (sub / ".git").symlink_to(temp_project_dir / "missing")
+
+        assert utils._project_root_for(str(sub)) == str(temp_project_dir)
+
+
+def stdin_with(payload: bytes) -> io.TextIOWrapper:
+    """A stand-in for sys.stdin whose .buffer yields payload."""
+    return io.TextIOWrapper(io.BytesIO(payload))
+
+
+class TestPeekToolName:
+    """Tests for _peek_tool_name function."""
+
+    def test_finds_top_level_tool_name(self):
+        """Test that the top-level tool_name is read from the head."""
+        assert utils._peek_tool_name(b'{"session_id": "s", "tool_name": "Write", "tool_input": {') == "Write"
+
+    def test_skips_nested_tool_name(self):
+        """Test that a tool_name inside a nested object is not taken."""
+        head = b'{"tool_input": {"tool_name": "Read", "list": [{"tool_name": "Grep"}]}, "tool_name": "Bash"'
+
+        assert utils._peek_tool_name(head) == "Bash"
+
+    def test_skips_tool_name_quoted_in_strings(self):
+        """Test that tool_name appearing as a value or inside a string is not taken."""
+        head = b'{"note": "tool_name", "text": "{\\"tool_name\\": \\"Read\\"}", "tool_name": "Edit", "x": "'
+
+        assert utils._peek_tool_name(head) == "Edit"
+
+    def test_decodes_escaped_value(self):
+        """Test that JSON escapes in the tool name are decoded."""
+        assert utils._peek_tool_name(b'{"tool_name": "Wr\\u0069te"}') == "Write"
+
+    def test_escaped_key_is_not_recognized(self):
+        """Test that an escaped spelling of the key defers to a full parse."""
+        assert utils._peek_tool_name(b'{"tool\\u005fname": "Read", "x": "') is None
+
+    def test_missing_tool_name_returns_none(self):
+        """Test that a head without tool_name yields None."""
+        assert utils._peek_tool_name(b'{"tool_input": {"content": "') is None
+
+
+class TestParseHookInputForTools:
+    """Tests for parse_hook_input_for_tools function."""
+
+    TOOLS = frozenset({"Write", "Edit"})
+
+    def payload(self, tool_name: str, size: int = 0, first: bool = True) -> bytes:
+        """A hook event for tool_name padded with roughly size bytes of result."""
+        event = {"tool_input": {"file_path": "a.py"}, "tool_result": "x" * size}
+        if first:
+            event = {"tool_name": tool_name, **event}
+        else:
+            event["tool_name"] = tool_name
+        return json.dumps(event).encode()
+
+    def parse(self, payload: bytes):
+        """Run the parser on payload as stdin, returning the result and stdin."""
+        stdin = stdin_with(payload)
+        with patch("sys.stdin", stdin):
+            return utils.parse_hook_input_for_tools(self.TOOLS), stdin
+
+    def test_small_wanted_payload_is_parsed(self):
+        """Test that an event shorter than the peek is parsed in full."""
+        data, _ = self.parse(self.payload("Write"))
+
+        assert data["tool_name"] == "Write"
+        assert data["tool_input"] == {"file_path": "a.py"}
+
+    def test_small_unwanted_payload_is_ignored(self):
+        """Test that a short event for another tool yields {}."""
+        data, _ = self.parse(self.payload("Read"))
+
+        assert data == {}
+
+    def test_large_wanted_payload_is_parsed(self):
+        """Test that an event longer than the peek is read to the end and parsed."""
+        payload = self.payload("Edit", size=3 * utils.HOOK_INPUT_PEEK_BYTES)
+
+        data, _ = self.parse(payload)
+
+        assert data["tool_name"] == "Edit"
+        assert len(data["tool_result"]) == 3 * utils.HOOK_INPUT_PEEK_BYTES
+
+    def test_large_unwanted_payload_is_drained(self):
+        """Test that a long event for another tool is read to EOF and yields {}."""
+        payload = self.payload("Read", size=3 * utils.HOOK_INPUT_PEEK_BYTES)
+
+        with patch.object(utils, "_loads", side_effect=AssertionError("decoded")):
+            data, stdin = self.parse(payload)
+
+        assert data == {}
+        assert stdin.buffer.read() == b""
+
+    def test_tool_name_after_peek_falls_back_to_full_parse(self):
+        """Test that an event whose tool_name is past the peek is still filtered correctly."""
+        wanted = self.payload("Write", size=2 * utils.HOOK_INPUT_PEEK_BYTES, first=False)
+        unwanted = self.payload("Read", size=2 * utils.HOOK_INPUT_PEEK_BYTES, first=False)
+
+        assert self.parse(wanted)[0]["tool_name"] == "Write"
+        assert self.parse(unwanted)[0] == {}
+
+    def test_exactly_peek_sized_payload_is_parsed(self):
+        """Test that an event of exactly HOOK_INPUT_PEEK_BYTES is not truncated."""
+        payload = self.payload("Write")
+        payload = self.payload("Write", size=utils.HOOK_INPUT_PEEK_BYTES - len(payload))
+        assert len(payload) == utils.HOOK_INPUT_PEEK_BYTES
+
+        data, _ = self.parse(payload)
+
+        assert data["tool_name"] == "Write"
+
+    @pytest.mark.parametrize("payload", [b"", b"   \n", b"not json", b'["Write"]'])
+    def test_empty_or_invalid_input_yields_empty_dict(self, payload):
+        """Test that unusable input yields {}."""
+        assert self.parse(payload)[0] == {}
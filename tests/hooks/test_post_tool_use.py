@@ -0,0 +1,54 @@
+"""
+Tests for hooks/essential/post_tool_use.py
+
+Tests the queue that batches tool usage notes into Beads updates.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+# Import the module under test (hooks directories are added in conftest)
+from post_tool_use import FLUSH_THRESHOLD, claim_notes, log_to_beads, pending_notes_dir
+
+
+@pytest.fixture
+def beads_cli(temp_project_dir, mock_beads_cli, monkeypatch):
+    """Record `bd` calls with a current task, queueing in the temp project."""
+    monkeypatch.setattr("tempfile.tempdir", str(temp_project_dir))
+    mock_run = mock_beads_cli({
+        ("current", "--json"): {"id": "bd-1"},
+        ("update",): {"success": True},
+    })
+    calls = []
+
+    def recording_run(cmd, *args, **kwargs):
+        calls.append(cmd[1:])
+        return mock_run(cmd, *args, **kwargs)
+
+    with patch("subprocess.run", recording_run):
+        yield calls
+
+
+class TestLogToBeads:
+    """Tests for log_to_beads function."""
+
+    def test_queues_notes_outside_beads_dir(self, beads_cli, temp_project_dir):
+        """Test that queued notes leave .beads untouched."""
+        log_to_beads("Write", "Created/wrote a.py")
+
+        assert os.listdir(temp_project_dir / ".beads") == []
+        assert not pending_notes_dir().startswith(str(temp_project_dir / ".beads"))
+        assert len(os.listdir(pending_notes_dir())) == 1
+        assert beads_cli == []
+
+    def test_sends_one_update_per_batch(self, beads_cli):
+        """Test that a full batch looks up the task once and sends one joined note."""
+        for i in range(FLUSH_THRESHOLD):
+            log_to_beads("Bash", f"Ran: step {i}")
+
+        assert [call[0] for call in beads_cli] == ["current", "update"]
+        note = beads_cli[1][beads_cli[1].index("--add-note") + 1]
+        assert note.count("\n") == FLUSH_THRESHOLD - 1
+        assert claim_notes() == []
@@ -0,0 +1,87 @@
+"""
+Tests for hooks/essential/pre_tool_use.py
+
+Tests the destructive-command and sensitive-file guards.
+"""
+
+import pytest
+
+# Import the module under test (hooks directories are added in conftest)
+from pre_tool_use import check_tool_use, is_blocked_command, is_sensitive_file_access
+
+
+class TestIsBlockedCommand:
+    """Tests for is_blocked_command function."""
+
+    @pytest.mark.parametrize("command", [
+        "rm -rf /",
+        "RM -RF ~/projects",
+        "sudo mkfs.ext4 /dev/sda1",
+        "dd if=image.iso of=/dev/sdb",
+        "git push origin --force main",
+        "Git Push origin --force master",
+    ])
+    def test_blocks_destructive_commands(self, command):
+        """Test that destructive commands are blocked whatever their case."""
+        blocked, reason = is_blocked_command(command)
+
+        assert blocked
+        assert reason.startswith("Blocked: Destructive pattern")
+
+    @pytest.mark.parametrize("command", ["git reset --hard HEAD~1", "git reset --hard head~12"])
+    def test_blocks_hard_reset_discarding_commits(self, command):
+        """Test that a hard reset back over commits is blocked."""
+        blocked, reason = is_blocked_command(command)
+
+        assert blocked
+        assert "reset" in reason
+
+    @pytest.mark.parametrize("command", [
+        "rm -rf build",
+        "git push origin feature",
+        "git reset --hard origin/main",
+        "ls -la",
+    ])
+    def test_allows_ordinary_commands(self, command):
+        """Test that everyday commands pass."""
+        assert is_blocked_command(command) == (False, "")
+
+
+class TestIsSensitiveFileAccess:
+    """Tests for is_sensitive_file_access function."""
+
+    @pytest.mark.parametrize("path", [
+        "/project/.env",
+        "/project/.ENV.production",
+        "/home/user/.aws/credentials",
+        "/home/user/.ssh/id_ed25519",
+        "config/secrets.json",
+    ])
+    def test_blocks_sensitive_paths(self, path):
+        """Test that secrets files are blocked."""
+        assert is_sensitive_file_access(path) == (True, f"Blocked: Sensitive file access '{path}'")
+
+    @pytest.mark.parametrize("path", ["/project/.env.example.md", "/project/src/env.ts", "README.md"])
+    def test_allows_other_paths(self, path):
+        """Test that ordinary files are not blocked."""
+        assert is_sensitive_file_access(path) == (False, "")
+
+
+class TestCheckToolUse:
+    """Tests for check_tool_use function."""
+
+    def test_checks_bash_commands(self):
+        """Test that Bash tool calls go through the command guard."""
+        blocked, _ = check_tool_use({"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}})
+
+        assert blocked
+
+    def test_checks_file_access(self):
+        """Test that file tools go through the sensitive-file guard."""
+        blocked, _ = check_tool_use({"tool_name": "Read", "tool_input": {"file_path": ".env"}})
+
+        assert blocked
+
+    def test_ignores_other_tools(self):
+        """Test that other tools are never blocked."""
+        assert check_tool_use({"tool_name": "Grep", "tool_input": {"pattern": "rm -rf /"}}) == (False, "")
@@ -0,0 +1,47 @@
+"""
+Tests for hooks/optional/quality_check.py
+
+Tests the test coverage suggestion for exported source files.
+"""
+
+import pytest
+
+# Import the module under test (hooks directories are added in conftest)
+from quality_check import suggest_tests
+
+EXPORTING_SOURCE = "export function add(a, b) { return a + b; }\n"
+
+
+class TestSuggestTests:
+    """Tests for suggest_tests function."""
+
+    @pytest.mark.parametrize("source, sibling", [
+        ("math.ts", "math.test.ts"),
+        ("math.ts", "math.spec.js"),
+        ("math.js", "math.test.ts"),
+        ("math.js", "math.spec.js"),
+        ("math.tsx", "math.test.tsx"),
+        ("math.tsx", "math.test.js"),
+        ("math.jsx", "math.spec.ts"),
+        ("math.mjs", "math.test.js"),
+        ("math.py", "test_math.py"),
+        ("math.py", "math_test.py"),
+    ])
+    def test_sibling_test_file_counts_as_coverage(self, temp_project_dir, source, sibling):
+        """Test that a test file next to the source suppresses the suggestion."""
+        (temp_project_dir / sibling).write_text("")
+
+        assert suggest_tests(EXPORTING_SOURCE, str(temp_project_dir / source)) == []
+
+    @pytest.mark.parametrize("source", ["math.ts", "math.js", "math.tsx", "math.py"])
+    def test_suggests_tests_when_none_exist(self, temp_project_dir, source):
+        """Test that an untested exporting source gets a suggestion."""
+        (temp_project_dir / "other.test.ts").write_text("")
+
+        suggestions = suggest_tests(EXPORTING_SOURCE, str(temp_project_dir / source))
+
+        assert suggestions == ["Consider adding tests for 1 exported function(s)"]
+
+    def test_no_exports_no_suggestion(self, temp_project_dir):
+        """Test that a source without exports is not flagged."""
+        assert suggest_tests("const x = 1;\n", str(temp_project_dir / "math.ts")) == []
@@ -5,14 +5,11 @@ Tests the session start hook that loads Beads context at session initialization.
 """
 
 import json
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Import the module under test
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hooks" / "essential"))
+# Import the module under test (hooks directories are added in conftest)
 from session_start import (
     run_beads_command,
     load_beads_context,